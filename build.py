@@ -5,89 +5,126 @@ Creates a standalone executable using PyInstaller.
 
 import os
 import sys
+import argparse
 import subprocess
 import shutil
+import logging
+import logging.handlers
+import tempfile
+import functools
+import importlib.util
 from pathlib import Path
 
+from config import FFMPEG_PATHS, LOGO_PATHS
+from utils.file_utils import first_existing
 
+log = logging.getLogger("build")
+
+# Newer pefile releases make PyInstaller's Windows binary analysis much slower
+PEFILE_REQUIREMENT = 'pefile<2024.8.26'
+
+
+def setup_logging():
+    """Route build output through a buffered console handler."""
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter('%(message)s'))
+    # Buffer messages and write them out in batches; errors flush immediately
+    buffered = logging.handlers.MemoryHandler(64, flushLevel=logging.ERROR, target=console)
+    log.addHandler(buffered)
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
+
+def flush_log():
+    """Write out buffered build messages (before handing the console to a subprocess)."""
+    for handler in log.handlers:
+        handler.flush()
+
+
+@functools.lru_cache(maxsize=1)
 def check_ffmpeg():
     """Check if FFmpeg is available."""
-    ffmpeg_paths = [
-        'ffmpeg.exe',
-        'bin/ffmpeg.exe',
-        'resources/ffmpeg.exe'
-    ]
-    
-    for path in ffmpeg_paths:
-        if os.path.exists(path):
-            print(f"✓ Found FFmpeg at: {path}")
-            return path
-    
-    print("✗ FFmpeg not found!")
-    print("Please download ffmpeg.exe and place it in the project root directory.")
-    print("Download from: https://ffmpeg.org/download.html")
+    path = first_existing(FFMPEG_PATHS)
+    if path:
+        log.info("✓ Found FFmpeg at: %s", path)
+        return path
+    
+    log.warning("✗ FFmpeg not found!")
+    log.warning("Please download ffmpeg.exe and place it in the project root directory.")
+    log.warning("Download from: https://ffmpeg.org/download.html")
     return None
 
 
 def install_pyinstaller():
     """Install PyInstaller if not available."""
+    # find_spec answers "is it installed?" without importing PyInstaller
+    if importlib.util.find_spec('PyInstaller') is not None:
+        log.info("✓ PyInstaller is already installed")
+        return True
+    
+    log.info("Installing PyInstaller...")
     try:
-        import PyInstaller
-        print("✓ PyInstaller is already installed")
+        packages = ['pyinstaller']
+        if sys.platform == 'win32':
+            packages.append(PEFILE_REQUIREMENT)
+        flush_log()
+        subprocess.check_call([sys.executable, '-m', 'pip', 'install', *packages])
+        log.info("✓ PyInstaller installed successfully")
         return True
-    except ImportError:
-        print("Installing PyInstaller...")
-        try:
-            subprocess.check_call([sys.executable, '-m', 'pip', 'install', 'pyinstaller'])
-            print("✓ PyInstaller installed successfully")
-            return True
-        except subprocess.CalledProcessError:
-            print("✗ Failed to install PyInstaller")
-            return False
+    except subprocess.CalledProcessError:
+        log.error("✗ Failed to install PyInstaller")
+        return False
 
 
-def build_executable():
+def build_executable(ffmpeg_path=None, onefile=False):
     """Build the executable using PyInstaller."""
-    print("Building FormatFusion executable...")
+    log.info("Building FormatFusion executable...")
     
     # PyInstaller command
     cmd = [
         'pyinstaller',
-        '--onefile',
+        '--onefile' if onefile else '--onedir',
         '--windowed',
         '--name=FormatFusion',
         '--clean',
         '--noconfirm'
     ]
     
+    # Development builds skip the single-file archive and UPX compression
+    if not onefile:
+        cmd.append('--noupx')
+    
     # Add FFmpeg if found
-    ffmpeg_path = check_ffmpeg()
     if ffmpeg_path:
         cmd.extend(['--add-data', f'{ffmpeg_path};.'])
     
     # Add logo if found
-    logo_paths = ['resources/logo.png', 'logo.png', 'assets/logo.png']
-    for logo_path in logo_paths:
-        if os.path.exists(logo_path):
-            cmd.extend(['--add-data', f'{logo_path};resources'])
-            break
+    logo_path = first_existing(LOGO_PATHS)
+    if logo_path:
+        cmd.extend(['--add-data', f'{logo_path};resources'])
     
     # Add main script
     cmd.append('main.py')
     
-    try:
-        subprocess.check_call(cmd)
-        print("✓ Executable built successfully!")
-        print("✓ Output: dist/FormatFusion.exe")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"✗ Build failed: {e}")
-        return False
+    flush_log()
+    # Give each build its own PyInstaller cache so concurrent builds don't contend;
+    # it is removed again when the build ends
+    with tempfile.TemporaryDirectory(prefix='pyi_') as config_dir:
+        env = os.environ.copy()
+        env['PYINSTALLER_CONFIG_DIR'] = config_dir
+        try:
+            subprocess.check_call(cmd, env=env)
+            log.info("✓ Executable built successfully!")
+            log.info("✓ Output: %s", 'dist/FormatFusion.exe' if onefile else 'dist/FormatFusion/')
+            return True
+        except subprocess.CalledProcessError as e:
+            log.error("✗ Build failed: %s", e)
+            return False
 
 
-def create_distribution():
+def create_distribution(ffmpeg_path=None, onefile=False):
     """Create distribution package."""
-    print("Creating distribution package...")
+    log.info("Creating distribution package...")
     
     dist_dir = Path('dist')
     package_dir = Path('FormatFusion-Package')
@@ -97,22 +134,27 @@ def create_distribution():
         shutil.rmtree(package_dir)
     package_dir.mkdir()
     
-    # Copy executable
-    exe_path = dist_dir / 'FormatFusion.exe'
-    if exe_path.exists():
-        shutil.copy2(exe_path, package_dir)
-        print("✓ Copied executable")
+    # Copy executable (a single file, or the whole onedir bundle)
+    if onefile:
+        exe_path = dist_dir / 'FormatFusion.exe'
+        if exe_path.exists():
+            shutil.copy2(exe_path, package_dir)
+            log.info("✓ Copied executable")
+    else:
+        bundle_dir = dist_dir / 'FormatFusion'
+        if bundle_dir.exists():
+            shutil.copytree(bundle_dir, package_dir, dirs_exist_ok=True)
+            log.info("✓ Copied executable bundle")
     
     # Copy FFmpeg if not bundled
-    ffmpeg_path = check_ffmpeg()
     if ffmpeg_path and not ffmpeg_path.startswith('dist'):
         shutil.copy2(ffmpeg_path, package_dir)
-        print("✓ Copied FFmpeg")
+        log.info("✓ Copied FFmpeg")
     
     # Copy README
     if os.path.exists('README.md'):
         shutil.copy2('README.md', package_dir)
-        print("✓ Copied README")
+        log.info("✓ Copied README")
     
     # Create batch file for easy launch
     batch_content = """@echo off
@@ -122,40 +164,56 @@ pause
 """
     with open(package_dir / 'Run-FormatFusion.bat', 'w') as f:
         f.write(batch_content)
-    print("✓ Created launcher batch file")
+    log.info("✓ Created launcher batch file")
     
-    print(f"✓ Distribution package created: {package_dir}")
+    log.info("✓ Distribution package created: %s", package_dir)
     return True
 
 
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Build the FormatFusion executable.")
+    parser.add_argument(
+        '--release',
+        action='store_true',
+        help="build a single-file executable (slower to build and to start)"
+    )
+    return parser.parse_args()
+
+
 def main():
     """Main build process."""
-    print("FormatFusion Build Script")
-    print("=" * 30)
+    args = parse_args()
+    setup_logging()
+    log.info("FormatFusion Build Script")
+    log.info("=" * 30)
     
     # Check Python version
     if sys.version_info < (3, 8):
-        print("✗ Python 3.8 or higher is required")
+        log.error("✗ Python 3.8 or higher is required")
         return False
     
-    print(f"✓ Python {sys.version.split()[0]} detected")
+    log.info("✓ Python %s detected", sys.version.split()[0])
     
     # Install PyInstaller
     if not install_pyinstaller():
         return False
     
+    # Locate FFmpeg once for both build stages
+    ffmpeg_path = check_ffmpeg()
+    
     # Build executable
-    if not build_executable():
+    if not build_executable(ffmpeg_path, onefile=args.release):
         return False
     
     # Create distribution
-    if not create_distribution():
+    if not create_distribution(ffmpeg_path, onefile=args.release):
         return False
     
-    print("\n" + "=" * 30)
-    print("Build completed successfully!")
-    print("Distribution package: FormatFusion-Package/")
-    print("Executable: dist/FormatFusion.exe")
+    log.info("\n" + "=" * 30)
+    log.info("Build completed successfully!")
+    log.info("Distribution package: FormatFusion-Package/")
+    log.info("Executable: %s", 'dist/FormatFusion.exe' if args.release else 'dist/FormatFusion/FormatFusion.exe')
     return True
 
 
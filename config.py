@@ -4,6 +4,7 @@ Contains application settings and constants.
 """
 
 import os
+import sys
 from pathlib import Path
 
 # Application information
@@ -17,17 +18,24 @@ MAX_IMAGE_SIZE = 100 * 1024 * 1024  # 100MB
 MAX_AUDIO_SIZE = 500 * 1024 * 1024  # 500MB
 MAX_VIDEO_SIZE = 2 * 1024 * 1024 * 1024  # 2GB
 
-# Supported file extensions
-SUPPORTED_IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.gif', '.webp'}
-SUPPORTED_AUDIO_EXTENSIONS = {'.wav', '.m4a', '.flac', '.ogg', '.mp3', '.aac', '.wma'}
-SUPPORTED_VIDEO_EXTENSIONS = {'.mkv', '.mov', '.avi', '.webm', '.flv', '.mp4', '.wmv', '.m4v'}
+# Supported file extensions (interned so lookups can match on identity)
+SUPPORTED_IMAGE_EXTENSIONS = frozenset(sys.intern(ext) for ext in ('.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.gif', '.webp'))
+SUPPORTED_AUDIO_EXTENSIONS = frozenset(sys.intern(ext) for ext in ('.wav', '.m4a', '.flac', '.ogg', '.mp3', '.aac', '.wma'))
+SUPPORTED_VIDEO_EXTENSIONS = frozenset(sys.intern(ext) for ext in ('.mkv', '.mov', '.avi', '.webm', '.flv', '.mp4', '.wmv', '.m4v'))
 
 # FFmpeg paths to check
-FFMPEG_PATHS = [
+FFMPEG_PATHS = (
     'ffmpeg.exe',
     'bin/ffmpeg.exe',
     'resources/ffmpeg.exe'
-]
+)
+
+# Logo paths to check (relative to the app base path and the working directory)
+LOGO_PATHS = (
+    'resources/logo.png',
+    'logo.png',
+    'assets/logo.png'
+)
 
 # Default conversion settings
 DEFAULT_IMAGE_FORMAT = 'png'
@@ -46,8 +54,15 @@ PROGRESS_UPDATE_INTERVAL = 100
 # Temporary directory for processing
 TEMP_DIR = Path(os.environ.get('TEMP', '/tmp')) / 'formatfusion'
 
+# Remembers the resolved logo path between launches
+LOGO_CACHE_FILE = TEMP_DIR / 'logo_path.txt'
+
+# Persistent cache directory (results that survive between launches)
+CACHE_DIR = Path.home() / '.cache' / 'formatfusion'
+HW_ACCEL_CACHE_FILE = CACHE_DIR / 'hw_accel.json'
+
 # Logging settings
-LOG_LEVEL = 'INFO'
+LOG_LEVEL = 'WARNING'  # set to 'DEBUG' for per-conversion traces
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 
 # Conversion timeouts (seconds)
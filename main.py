@@ -4,17 +4,22 @@ Main application entry point.
 """
 
 import sys
-import os
-from pathlib import Path
-from PyQt6.QtWidgets import QApplication, QMessageBox
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon
+import logging
+import shutil
+import functools
+import importlib.util
 
-from views.main_window import MainWindow
+from config import FFMPEG_PATHS, LOG_LEVEL, LOG_FORMAT
+from utils.file_utils import first_existing, get_logo_path
+
+logger = logging.getLogger(__name__)
 
 
 def setup_application():
     """Setup the PyQt6 application."""
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import Qt
+    
     # Enable high DPI scaling (PyQt6 uses different attribute names)
     try:
         QApplication.setAttribute(Qt.ApplicationAttribute.AA_EnableHighDpiScaling, True)
@@ -32,112 +37,98 @@ def setup_application():
     app.setStyle('Fusion')
     
     # Apply custom dark theme
-    from views.main_window import ThemeManager
+    from views.main_window import ThemeManager, app_icon
     ThemeManager.apply_theme(app)
     
-    # Set application icon with proper path handling
-    def get_logo_path():
-        """Get the correct path for the logo file."""
-        if getattr(sys, 'frozen', False):
-            # Running as PyInstaller executable
-            base_path = sys._MEIPASS
-        else:
-            # Running as script
-            base_path = os.path.dirname(os.path.abspath(__file__))
-        
-        logo_paths = [
-            os.path.join(base_path, "resources", "logo.png"),
-            os.path.join(base_path, "logo.png"),
-            os.path.join(base_path, "assets", "logo.png"),
-            "resources/logo.png",  # Fallback for development
-            "logo.png",
-            "assets/logo.png"
-        ]
-        
-        for path in logo_paths:
-            if os.path.exists(path):
-                return path
-        return None
-    
+    # Set application icon (built once from the same decoded logo the main window uses)
+    app.setWindowIcon(app_icon())
     logo_path = get_logo_path()
     if logo_path:
-        app.setWindowIcon(QIcon(logo_path))
-        print(f"App icon set from: {logo_path}")
+        logger.debug("App icon set from: %s", logo_path)
     else:
-        print("No logo found, using default icon")
+        logger.debug("No logo found, using fallback icon")
     
     return app
 
 
 def check_dependencies():
-    """Check if required dependencies are available."""
+    """Check if required dependencies are available (runs before Qt is loaded)."""
     missing_deps = []
     
-    try:
-        import PIL
-    except ImportError:
-        missing_deps.append("Pillow (PIL)")
-    
-    try:
-        import ffmpeg
-    except ImportError:
-        missing_deps.append("ffmpeg-python")
+    # find_spec only locates the packages; it doesn't run their import-time setup
+    for module_name, label in (("PyQt6", "PyQt6"), ("PIL", "Pillow (PIL)"), ("ffmpeg", "ffmpeg-python")):
+        if importlib.util.find_spec(module_name) is None:
+            missing_deps.append(label)
     
     if missing_deps:
         error_msg = f"Missing required dependencies:\n{chr(10).join(f'- {dep}' for dep in missing_deps)}\n\n"
         error_msg += "Please install them using:\npip install -r requirements.txt"
         
-        QMessageBox.critical(None, "Missing Dependencies", error_msg)
+        # Windowed builds have no console, so show a dialog whenever Qt itself is installed
+        if "PyQt6" in missing_deps:
+            print(error_msg, file=sys.stderr)
+        else:
+            from PyQt6.QtWidgets import QApplication, QMessageBox
+            # A dialog needs an application object (kept referenced while it is shown)
+            app = QApplication.instance() or QApplication(sys.argv)
+            QMessageBox.critical(None, "Missing Dependencies", error_msg)
         return False
     
     return True
 
 
+@functools.lru_cache(maxsize=1)
+def find_ffmpeg():
+    """Locate the FFmpeg executable, returning its path or None."""
+    # Check if ffmpeg is in PATH (pure path lookup, no process spawn)
+    path = shutil.which('ffmpeg')
+    if path:
+        return path
+    
+    # Check for bundled ffmpeg.exe
+    return first_existing(FFMPEG_PATHS)
+
+
 def check_ffmpeg():
     """Check if FFmpeg is available."""
-    try:
-        import subprocess
-        result = subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True, timeout=10)
+    if find_ffmpeg():
         return True
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-        # Check for bundled ffmpeg.exe
-        possible_paths = [
-            'ffmpeg.exe',
-            'bin/ffmpeg.exe',
-            'resources/ffmpeg.exe'
-        ]
-        
-        for path in possible_paths:
-            if os.path.exists(path):
-                return True
-        
-        error_msg = "FFmpeg not found!\n\n"
-        error_msg += "Please ensure ffmpeg.exe is available in one of these locations:\n"
-        error_msg += "- Current directory\n"
-        error_msg += "- bin/ directory\n"
-        error_msg += "- resources/ directory\n"
-        error_msg += "- System PATH\n\n"
-        error_msg += "You can download FFmpeg from: https://ffmpeg.org/download.html"
-        
-        QMessageBox.critical(None, "FFmpeg Not Found", error_msg)
-        return False
+    
+    from PyQt6.QtWidgets import QMessageBox
+    
+    error_msg = "FFmpeg not found!\n\n"
+    error_msg += "Please ensure ffmpeg.exe is available in one of these locations:\n"
+    error_msg += "- Current directory\n"
+    error_msg += "- bin/ directory\n"
+    error_msg += "- resources/ directory\n"
+    error_msg += "- System PATH\n\n"
+    error_msg += "You can download FFmpeg from: https://ffmpeg.org/download.html"
+    
+    QMessageBox.critical(None, "FFmpeg Not Found", error_msg)
+    return False
 
 
 def main():
     """Main application entry point."""
-    # Setup application
-    app = setup_application()
+    logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT)
     
-    # Check dependencies
+    # Check dependencies before loading any Qt libraries
     if not check_dependencies():
         sys.exit(1)
     
+    from PyQt6.QtWidgets import QMessageBox
+    
+    # Setup application
+    app = setup_application()
+    
     # Check FFmpeg availability
     if not check_ffmpeg():
         sys.exit(1)
     
     # Create and show main window
     try:
+        from views.main_window import MainWindow
+        
         main_window = MainWindow()
         main_window.show()
         
@@ -3,13 +3,17 @@ Conversion options model for FormatFusion.
 Represents user-selected conversion parameters.
 """
 
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
 from .file_info import FileType, ImageFormat, AudioQuality, VideoQuality
 
+# Slotted dataclasses (smaller instances, faster attribute access) need Python 3.10+
+_DATACLASS_KWARGS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_KWARGS)
 class ImageConversionOptions:
     """Options for image conversion."""
     output_format: ImageFormat
@@ -20,20 +24,20 @@ class ImageConversionOptions:
     max_size_kb: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class AudioConversionOptions:
     """Options for audio conversion."""
     quality: AudioQuality = AudioQuality.GOOD
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class VideoConversionOptions:
     """Options for video conversion."""
     quality: VideoQuality = VideoQuality.ORIGINAL
     fast_mode: bool = True  # Enable fast conversion by default
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class ConversionOptions:
     """Main conversion options container."""
     file_type: FileType
@@ -43,23 +47,21 @@ class ConversionOptions:
     
     def __post_init__(self):
         """Initialize specific options based on file type."""
-        if self.file_type == FileType.IMAGE and self.image_options is None:
-            self.image_options = ImageConversionOptions(ImageFormat.PNG)
-        elif self.file_type == FileType.AUDIO and self.audio_options is None:
-            self.audio_options = AudioConversionOptions()
-        elif self.file_type == FileType.VIDEO and self.video_options is None:
-            self.video_options = VideoConversionOptions()
+        entry = _DEFAULT_OPTIONS.get(self.file_type)
+        if entry:
+            attr, factory = entry
+            if getattr(self, attr) is None:
+                setattr(self, attr, factory())
     
     def is_valid(self) -> bool:
         """Check if conversion options are valid."""
-        if self.file_type == FileType.UNSUPPORTED:
-            return False
-        
-        if self.file_type == FileType.IMAGE:
-            return self.image_options is not None
-        elif self.file_type == FileType.AUDIO:
-            return self.audio_options is not None
-        elif self.file_type == FileType.VIDEO:
-            return self.video_options is not None
-        
-        return False
+        entry = _DEFAULT_OPTIONS.get(self.file_type)
+        return entry is not None and getattr(self, entry[0]) is not None
+
+
+# File type -> (options attribute, default options factory)
+_DEFAULT_OPTIONS = {
+    FileType.IMAGE: ('image_options', lambda: ImageConversionOptions(ImageFormat.PNG)),
+    FileType.AUDIO: ('audio_options', AudioConversionOptions),
+    FileType.VIDEO: ('video_options', VideoConversionOptions),
+}
@@ -3,12 +3,17 @@ File information model for FormatFusion.
 Represents file metadata and type information.
 """
 
+import os
+import stat
+import sys
 from enum import Enum
 from pathlib import Path
 from typing import Optional
 
+from config import SUPPORTED_IMAGE_EXTENSIONS, SUPPORTED_AUDIO_EXTENSIONS, SUPPORTED_VIDEO_EXTENSIONS
 
-class FileType(Enum):
+
+class FileType(str, Enum):
     """Supported file types for conversion."""
     IMAGE = "image"
     AUDIO = "audio"
@@ -16,13 +21,14 @@ class FileType(Enum):
     UNSUPPORTED = "unsupported"
 
 
-class ImageFormat(Enum):
+class ImageFormat(str, Enum):
     """Supported image output formats."""
     JPG = "jpg"
     PNG = "png"
+    WEBP = "webp"
 
 
-class AudioQuality(Enum):
+class AudioQuality(str, Enum):
     """Audio quality presets."""
     STANDARD = "128"
     GOOD = "192"
@@ -30,7 +36,7 @@ class AudioQuality(Enum):
     LOSSLESS = "320"
 
 
-class VideoQuality(Enum):
+class VideoQuality(str, Enum):
     """Video quality presets."""
     SD_480P = "480p"
     HD_720P = "720p"
@@ -38,58 +44,93 @@ class VideoQuality(Enum):
     ORIGINAL = "original"
 
 
+# Units for formatted file sizes, one per power of 1024
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
 class FileInfo:
     """Model representing file information and metadata."""
     
+    __slots__ = (
+        '_path_str', '_path', 'filename', 'extension', '_ext_lower',
+        'file_type', 'file_size', 'is_valid', '_size_formatted', '_duration'
+    )
+    
+    # Extension -> file type lookup, built once at import (most common types first)
+    _DISPATCH = {
+        **{ext: FileType.IMAGE for ext in SUPPORTED_IMAGE_EXTENSIONS},
+        **{ext: FileType.VIDEO for ext in SUPPORTED_VIDEO_EXTENSIONS},
+        **{ext: FileType.AUDIO for ext in SUPPORTED_AUDIO_EXTENSIONS},
+    }
+    
     def __init__(self, file_path: str):
-        self.file_path = Path(file_path)
-        self.file_type = self._detect_file_type()
+        self._init_path(file_path)
         self.file_size = self._get_file_size()
+    
+    def _init_path(self, file_path: str):
+        """Initialize path-derived attributes."""
+        # Keep the raw string and split it once; the Path is built lazily
+        self._path_str = os.fspath(file_path)
+        self._path = None
+        # filename (without extension) and extension are plain attributes;
+        # extensions are interned so a batch shares one string per extension
+        stem, extension = os.path.splitext(os.path.basename(self._path_str))
+        self.filename = stem
+        self.extension = sys.intern(extension)
+        self._ext_lower = sys.intern(extension.lower())
+        self.file_type = self._detect_file_type()
         self.is_valid = self.file_type != FileType.UNSUPPORTED
+        self._size_formatted = None
+        self._duration = None
     
     def _detect_file_type(self) -> FileType:
         """Detect file type based on extension."""
-        extension = self.file_path.suffix.lower()
-        
-        image_extensions = {'.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.gif', '.webp'}
-        audio_extensions = {'.wav', '.m4a', '.flac', '.ogg', '.mp3', '.aac', '.wma'}
-        video_extensions = {'.mkv', '.mov', '.avi', '.webm', '.flv', '.mp4', '.wmv', '.m4v'}
-        
-        if extension in image_extensions:
-            return FileType.IMAGE
-        elif extension in audio_extensions:
-            return FileType.AUDIO
-        elif extension in video_extensions:
-            return FileType.VIDEO
-        else:
-            return FileType.UNSUPPORTED
+        return self._DISPATCH.get(self._ext_lower, FileType.UNSUPPORTED)
     
     def _get_file_size(self) -> int:
         """Get file size in bytes."""
         try:
-            return self.file_path.stat().st_size
+            # lstat skips symlink resolution; fall back to stat only for actual links
+            stat_result = os.lstat(self._path_str)
+            if stat.S_ISLNK(stat_result.st_mode):
+                stat_result = os.stat(self._path_str)
+            return stat_result.st_size
         except (OSError, FileNotFoundError):
             return 0
     
     @property
-    def filename(self) -> str:
-        """Get filename without extension."""
-        return self.file_path.stem
-    
-    @property
-    def extension(self) -> str:
-        """Get file extension."""
-        return self.file_path.suffix
+    def file_path(self) -> Path:
+        """Get the file path as a Path object."""
+        if self._path is None:
+            self._path = Path(self._path_str)
+        return self._path
     
     @property
     def size_formatted(self) -> str:
         """Get formatted file size string."""
-        size = self.file_size
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} TB"
+        if self._size_formatted is None:
+            # Each unit step is 10 bits, so the unit index follows from bit_length
+            index = max(0, min(len(_SIZE_UNITS) - 1, (self.file_size.bit_length() - 1) // 10))
+            self._size_formatted = f"{self.file_size / (1 << (index * 10)):.1f} {_SIZE_UNITS[index]}"
+        return self._size_formatted
+    
+    @property
+    def duration(self) -> float:
+        """Get media duration in seconds (0.0 for images or if unknown)."""
+        if self._duration is None:
+            self._duration = 0.0
+            if self.file_type in (FileType.AUDIO, FileType.VIDEO):
+                try:
+                    import ffmpeg
+                    # Probe once per file; the container duration covers all streams
+                    probe = ffmpeg.probe(self._path_str)
+                    duration = probe.get('format', {}).get('duration')
+                    if duration is None and probe.get('streams'):
+                        duration = probe['streams'][0].get('duration')
+                    self._duration = float(duration or 0)
+                except Exception:
+                    pass
+        return self._duration
     
     def __str__(self) -> str:
         return f"FileInfo({self.filename}{self.extension}, {self.file_type.value}, {self.size_formatted})"
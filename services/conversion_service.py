@@ -3,17 +3,73 @@ Conversion service for handling file conversions.
 Supports image, audio, and video conversion using appropriate libraries.
 """
 
+import collections
+import contextlib
+import io
+import json
+import logging
+import math
+import mmap
 import os
+import shutil
 import subprocess
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple
 
 from PIL import Image
 import ffmpeg
 
+from config import FFMPEG_PATHS, HW_ACCEL_CACHE_FILE
 from models.file_info import FileInfo, FileType
 from models.conversion_options import ConversionOptions, ImageConversionOptions
+from utils.file_utils import copy_file_with_progress, first_existing
+
+logger = logging.getLogger(__name__)
+
+# Output format value -> Pillow format name
+_PIL_FORMAT_MAP = {
+    'jpg': 'JPEG',
+    'jpeg': 'JPEG',
+    'png': 'PNG',
+    'webp': 'WEBP',
+    'bmp': 'BMP',
+    'tiff': 'TIFF'
+}
+
+# Input extensions that already are one of the image output formats
+_IMAGE_EXTENSION_FORMATS = {'.jpg': 'jpg', '.jpeg': 'jpg', '.png': 'png', '.webp': 'webp'}
+
+# Pillow save options at a given quality for the lossy formats. WebP uses method 4:
+# method 6 is ~3.5x slower per encode for well under 1% smaller files
+_LOSSY_SAVE_OPTIONS = {
+    'JPEG': lambda quality: {'quality': quality, 'optimize': True},
+    'WEBP': lambda quality: {'quality': quality, 'method': 4},
+}
+
+# JPEG quality used for the initial size-limit probe (Pillow's default quality)
+PROBE_JPEG_QUALITY = 75
+
+# Aggressive resizing: predicted scales are shrunk by this margin, an encode
+# within RESIZE_ACCEPT_RATIO of the target is accepted as-is, and the scale is
+# re-predicted at most RESIZE_MAX_ATTEMPTS times
+RESIZE_SCALE_MARGIN = 0.95
+RESIZE_ACCEPT_RATIO = 0.9
+RESIZE_MAX_ATTEMPTS = 4
+
+# Quality candidates encoded concurrently per round of the size-limit quality search
+QUALITY_SEARCH_WORKERS = 4
+
+# Images larger than this are memory-mapped rather than read into the heap
+MMAP_IMAGE_THRESHOLD = 32 * 1024 * 1024
+
+# Lines of FFmpeg's stderr kept for the error raised when a progress-reporting run fails
+FFMPEG_STDERR_TAIL_LINES = 50
+
+# DRM render node used for VAAPI encoding
+VAAPI_DEVICE = '/dev/dri/renderD128'
 
 
 class ConversionService:
@@ -21,26 +77,27 @@ class ConversionService:
     
     def __init__(self):
         self.ffmpeg_path = self._find_ffmpeg()
+        # Encoder support doesn't change while the app runs, so detect it once
+        self.hw_accel = self._detect_hardware_acceleration()
+        # Number of video conversions currently running (shares the FFmpeg thread budget)
+        self.active_jobs = 0
+        self._active_jobs_lock = threading.Lock()
+        # Running FFmpeg processes, so shutdown() can stop them mid-encode
+        self._processes = set()
+        self._processes_lock = threading.Lock()
+        self._stopped = False
     
     def _find_ffmpeg(self) -> str:
         """Find FFmpeg executable path."""
-        # Check if ffmpeg is in PATH
-        try:
-            subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True)
-            return 'ffmpeg'
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
-        
-        # Check for bundled ffmpeg.exe
-        possible_paths = [
-            'ffmpeg.exe',
-            'bin/ffmpeg.exe',
-            'resources/ffmpeg.exe'
-        ]
+        # Check if ffmpeg is in PATH (pure path lookup, no process spawn)
+        path = shutil.which('ffmpeg')
+        if path:
+            return path
         
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
+        # Check for bundled ffmpeg.exe (the same locations main.py checks)
+        path = first_existing(FFMPEG_PATHS)
+        if path:
+            return path
         
         raise RuntimeError("FFmpeg not found. Please ensure ffmpeg.exe is available.")
     
@@ -73,7 +130,7 @@ class ConversionService:
             else:
                 return False
         except Exception as e:
-            print(f"Conversion error: {e}")
+            logger.error("Conversion error: %s", e)
             return False
     
     def _convert_image(
@@ -83,8 +140,19 @@ class ConversionService:
         output_path: str
     ) -> bool:
         """Convert image file."""
+        # Same format with no resize or size limit: the re-encode would only cost time
+        # (and JPEG quality), so copy the file instead
+        if (
+            _IMAGE_EXTENSION_FORMATS.get(file_info.extension.lower()) == options.output_format.value
+            and not options.resize_enabled
+            and not options.size_limit_enabled
+        ):
+            if os.path.abspath(file_info.file_path) == os.path.abspath(output_path):
+                return True
+            return copy_file_with_progress(str(file_info.file_path), output_path)
+        
         try:
-            with Image.open(file_info.file_path) as img:
+            with self._open_image(file_info) as img:
                 # Convert to RGB if necessary for JPEG
                 if options.output_format.value == 'jpg' and img.mode in ('RGBA', 'LA', 'P'):
                     img = img.convert('RGB')
@@ -93,138 +161,207 @@ class ConversionService:
                 if options.resize_enabled and options.max_width and options.max_height:
                     img.thumbnail((options.max_width, options.max_height), Image.Resampling.LANCZOS)
                 
+                format_name = _PIL_FORMAT_MAP[options.output_format.value.lower()]
+                
                 # Optimize for size if requested
                 if options.size_limit_enabled and options.max_size_kb:
-                    # Check if we need optimization
-                    temp_path = output_path + '.check'
-                    format_name = 'JPEG' if options.output_format.value.upper() == 'JPG' else options.output_format.value.upper()
-                    img.save(temp_path, format=format_name)
-                    current_size = os.path.getsize(temp_path)
-                    os.remove(temp_path)
+                    # Check if we need optimization with an in-memory encode
+                    if format_name in _LOSSY_SAVE_OPTIONS:
+                        # Probe at the same settings the quality search uses, so its
+                        # result also bounds the search
+                        buffer = self._encode_to_buffer(
+                            img, format_name, **_LOSSY_SAVE_OPTIONS[format_name](PROBE_JPEG_QUALITY)
+                        )
+                    else:
+                        buffer = self._encode_to_buffer(img, format_name)
                     
                     max_size_bytes = options.max_size_kb * 1024
-                    if current_size <= max_size_bytes:
-                        # File is already small enough, just save normally
-                        img.save(output_path, format=format_name)
+                    if buffer.tell() <= max_size_bytes:
+                        # File is already small enough, write the probe encode as-is
+                        self._write_buffer(buffer, output_path)
                     else:
-                        # Need optimization
-                        output_path = self._optimize_image_size(img, output_path, options)
+                        # Need optimization; qualities at or above the probe are too large
+                        output_path = self._optimize_image_size(
+                            img, output_path, options, format_name, max_quality=PROBE_JPEG_QUALITY - 1,
+                            probe_size=buffer.tell() if format_name in _LOSSY_SAVE_OPTIONS else None
+                        )
                 else:
                     # Save with appropriate format
-                    format_name = 'JPEG' if options.output_format.value.upper() == 'JPG' else options.output_format.value.upper()
                     img.save(output_path, format=format_name)
                 
                 return True
         except Exception as e:
-            print(f"Image conversion error: {e}")
+            logger.error("Image conversion error: %s", e)
             return False
     
-    def _optimize_image_size(self, img: Image.Image, output_path: str, options: ImageConversionOptions) -> str:
+    @contextlib.contextmanager
+    def _open_image(self, file_info: FileInfo):
+        """Open an image, memory-mapping large files instead of reading them into the heap."""
+        if file_info.file_size <= MMAP_IMAGE_THRESHOLD:
+            with Image.open(file_info.file_path) as img:
+                yield img
+            return
+        
+        # PIL reads straight from the mapping; pages are faulted in on demand from the page cache
+        with open(file_info.file_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                Image.open(mapped) as img:
+            yield img
+    
+    def _optimize_image_size(
+        self,
+        img: Image.Image,
+        output_path: str,
+        options: ImageConversionOptions,
+        format_name: str,
+        max_quality: int = 95,
+        probe_size: Optional[int] = None
+    ) -> str:
         """Optimize image to meet size requirements."""
         max_size_bytes = options.max_size_kb * 1024
-        format_name = 'JPEG' if options.output_format.value.upper() == 'JPG' else options.output_format.value.upper()
         
-        print(f"Target size: {max_size_bytes} bytes ({options.max_size_kb} KB)")
+        logger.debug("Target size: %s bytes (%s KB)", max_size_bytes, options.max_size_kb)
         
-        # Try different quality levels for JPEG
-        if format_name == 'JPEG':
-            # Try quality levels from 95% down to 5%
-            for quality in range(95, 4, -5):
-                temp_path = output_path + '.tmp'
-                try:
-                    img.save(temp_path, format=format_name, quality=quality, optimize=True)
-                    file_size = os.path.getsize(temp_path)
-                    print(f"Quality {quality}%: {file_size} bytes")
-                    
-                    if file_size <= max_size_bytes:
-                        os.replace(temp_path, output_path)
-                        print(f"Success! Final size: {file_size} bytes")
-                        return output_path
-                    else:
-                        os.remove(temp_path)
-                except Exception as e:
-                    print(f"Error with quality {quality}: {e}")
-                    if os.path.exists(temp_path):
-                        os.remove(temp_path)
-            
-            # If still too large, try aggressive resizing
-            return self._aggressive_resize_for_size(img, output_path, max_size_bytes, format_name)
+        if format_name in _LOSSY_SAVE_OPTIONS:
+            best_buffer, _ = self._search_quality(img, format_name, max_size_bytes, 5, max_quality)
         else:
-            # For PNG, try different compression levels (0-9, where 9 is maximum compression)
-            for compress_level in range(9, -1, -1):
-                temp_path = output_path + '.tmp'
-                try:
-                    img.save(temp_path, format=format_name, compress_level=compress_level, optimize=True)
-                    file_size = os.path.getsize(temp_path)
-                    print(f"Compression level {compress_level}: {file_size} bytes")
+            # PNG is lossless at every compression level and level 9 is always the
+            # smallest, so a single maximum-compression encode decides whether it fits
+            buffer = self._encode_to_buffer(img, format_name, compress_level=9, optimize=True)
+            file_size = buffer.tell()
+            logger.debug("Compression level 9: %s bytes", file_size)
+            best_buffer = buffer if file_size <= max_size_bytes else None
+            # The level 9 encode is aggressive resizing's reference probe
+            probe_size = file_size
+        
+        if best_buffer is not None:
+            self._write_buffer(best_buffer, output_path)
+            logger.debug("Success! Final size: %s bytes", best_buffer.tell())
+            return output_path
+        
+        # If still too large, try aggressive resizing
+        return self._aggressive_resize_for_size(img, output_path, max_size_bytes, format_name, probe_size)
+    
+    def _search_quality(
+        self,
+        img: Image.Image,
+        format_name: str,
+        max_size_bytes: int,
+        low: int,
+        high: int
+    ) -> Tuple[Optional[io.BytesIO], Optional[int]]:
+        """
+        Find the highest quality in [low, high] whose encode fits in max_size_bytes.
+        
+        File size grows with quality, so this is a k-ary search: each round encodes
+        evenly spaced qualities concurrently (Pillow releases the GIL while encoding)
+        and narrows the range around the fit/no-fit boundary. With one worker it is
+        a plain binary search.
+        
+        Returns:
+            (buffer of the best fitting encode or None, smallest encoded size seen or None)
+        """
+        best_buffer = None
+        smallest_size = None
+        save_options = _LOSSY_SAVE_OPTIONS[format_name]
+        workers = max(1, min(QUALITY_SEARCH_WORKERS, os.cpu_count() or 1))
+        # Image.save() stores its options on the image, so concurrent encodes each need their own copy
+        images = [img] + [img.copy() for _ in range(min(workers, high - low + 1) - 1)]
+        
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            while low <= high:
+                count = min(workers, high - low + 1)
+                qualities = sorted({low + (high - low) * (i + 1) // (count + 1) for i in range(count)})
+                futures = [
+                    pool.submit(self._encode_to_buffer, image, format_name, **save_options(quality))
+                    for image, quality in zip(images, qualities)
+                ]
+                
+                # Walk up from the lowest quality; everything above the first miss is too large
+                for quality, future in zip(qualities, futures):
+                    buffer = future.result()
+                    file_size = buffer.tell()
+                    logger.debug("Quality %s%%: %s bytes", quality, file_size)
+                    smallest_size = file_size if smallest_size is None else min(smallest_size, file_size)
                     
                     if file_size <= max_size_bytes:
-                        os.replace(temp_path, output_path)
-                        print(f"Success! Final size: {file_size} bytes")
-                        return output_path
+                        best_buffer = buffer
+                        low = quality + 1
                     else:
-                        os.remove(temp_path)
-                except Exception as e:
-                    print(f"Error with compression {compress_level}: {e}")
-                    if os.path.exists(temp_path):
-                        os.remove(temp_path)
-            
-            # If still too large, try aggressive resizing
-            return self._aggressive_resize_for_size(img, output_path, max_size_bytes, format_name)
+                        high = quality - 1
+                        break
+        
+        return best_buffer, smallest_size
+    
+    def _encode_to_buffer(self, img: Image.Image, format_name: str, **save_kwargs) -> io.BytesIO:
+        """Encode image into an in-memory buffer; its size is buffer.tell()."""
+        buffer = io.BytesIO()
+        img.save(buffer, format=format_name, **save_kwargs)
+        return buffer
     
-    def _aggressive_resize_for_size(self, img: Image.Image, output_path: str, max_size_bytes: int, format_name: str) -> str:
+    def _write_buffer(self, buffer: io.BytesIO, output_path: str):
+        """Write an encoded image buffer to the output file."""
+        with open(output_path, 'wb') as f:
+            f.write(buffer.getbuffer())
+    
+    def _aggressive_resize_for_size(
+        self,
+        img: Image.Image,
+        output_path: str,
+        max_size_bytes: int,
+        format_name: str,
+        probe_size: Optional[int] = None
+    ) -> str:
         """Aggressively resize image to meet size requirements."""
-        print("Trying aggressive resizing...")
+        logger.debug("Trying aggressive resizing...")
         
-        # Start with 50% of original size and work down
-        for scale in [0.5, 0.3, 0.2, 0.1, 0.05]:
+        # Encoded size is roughly proportional to pixel count, so a full-size probe
+        # at the reference settings predicts the scale that fits directly
+        if format_name in _LOSSY_SAVE_OPTIONS:
+            reference_kwargs = _LOSSY_SAVE_OPTIONS[format_name](PROBE_JPEG_QUALITY)
+        else:
+            reference_kwargs = {'compress_level': 9, 'optimize': True}
+        if probe_size is None:
+            probe_size = self._encode_to_buffer(img, format_name, **reference_kwargs).tell()
+        
+        scale = min(1.0, math.sqrt(max_size_bytes / probe_size) * RESIZE_SCALE_MARGIN)
+        for _ in range(RESIZE_MAX_ATTEMPTS):
             new_size = (int(img.width * scale), int(img.height * scale))
             if new_size[0] < 10 or new_size[1] < 10:
                 break
-                
+            
             resized_img = img.resize(new_size, Image.Resampling.LANCZOS)
+            buffer = self._encode_to_buffer(resized_img, format_name, **reference_kwargs)
+            file_size = buffer.tell()
+            smallest_size = file_size
+            logger.debug("Scale %.3f, reference settings: %s bytes", scale, file_size)
             
-            if format_name == 'JPEG':
-                # Try different quality levels with resized image
-                for quality in range(85, 4, -10):
-                    temp_path = output_path + '.tmp'
-                    try:
-                        resized_img.save(temp_path, format=format_name, quality=quality, optimize=True)
-                        file_size = os.path.getsize(temp_path)
-                        print(f"Scale {scale}, Quality {quality}%: {file_size} bytes")
-                        
-                        if file_size <= max_size_bytes:
-                            os.replace(temp_path, output_path)
-                            print(f"Success with resizing! Final size: {file_size} bytes")
-                            return output_path
-                        else:
-                            os.remove(temp_path)
-                    except Exception as e:
-                        if os.path.exists(temp_path):
-                            os.remove(temp_path)
-            else:
-                # For PNG, try different compression levels with resized image
-                for compress_level in range(9, -1, -2):
-                    temp_path = output_path + '.tmp'
-                    try:
-                        resized_img.save(temp_path, format=format_name, compress_level=compress_level, optimize=True)
-                        file_size = os.path.getsize(temp_path)
-                        print(f"Scale {scale}, Compression {compress_level}: {file_size} bytes")
-                        
-                        if file_size <= max_size_bytes:
-                            os.replace(temp_path, output_path)
-                            print(f"Success with resizing! Final size: {file_size} bytes")
-                            return output_path
-                        else:
-                            os.remove(temp_path)
-                    except Exception as e:
-                        if os.path.exists(temp_path):
-                            os.remove(temp_path)
+            best_buffer = buffer if file_size <= max_size_bytes else None
+            if format_name in _LOSSY_SAVE_OPTIONS and not (best_buffer and file_size >= max_size_bytes * RESIZE_ACCEPT_RATIO):
+                # Missed the target: binary search the quality at this scale, upwards
+                # into the headroom if it fits or downwards if it doesn't
+                if best_buffer:
+                    low, high = PROBE_JPEG_QUALITY + 1, 95
+                else:
+                    low, high = 5, PROBE_JPEG_QUALITY - 1
+                found_buffer, searched_size = self._search_quality(
+                    resized_img, format_name, max_size_bytes, low, high
+                )
+                best_buffer = found_buffer or best_buffer
+                smallest_size = min(smallest_size, searched_size or smallest_size)
+            
+            if best_buffer is not None:
+                self._write_buffer(best_buffer, output_path)
+                logger.debug("Success with resizing! Final size: %s bytes", best_buffer.tell())
+                return output_path
+            
+            # Even the smallest encode is too large; shrink by the predicted factor
+            scale *= math.sqrt(max_size_bytes / smallest_size) * RESIZE_SCALE_MARGIN
         
         # If we still can't meet the requirement, save with minimum settings
-        print("Could not meet size requirement, saving with minimum settings")
-        if format_name == 'JPEG':
-            img.save(output_path, format=format_name, quality=5, optimize=True)
+        logger.warning("Could not meet size requirement, saving with minimum settings")
+        if format_name in _LOSSY_SAVE_OPTIONS:
+            img.save(output_path, format=format_name, **_LOSSY_SAVE_OPTIONS[format_name](5))
         else:
             img.save(output_path, format=format_name, compress_level=9, optimize=True)
         return output_path
@@ -250,10 +387,10 @@ class ConversionService:
             )
             
             # Run conversion
-            ffmpeg.run(output_stream, overwrite_output=True, quiet=True)
+            self._run_ffmpeg(output_stream, output_path)
             return True
         except Exception as e:
-            print(f"Audio conversion error: {e}")
+            logger.error("Audio conversion error: %s", e)
             return False
     
     def _convert_video(
@@ -264,12 +401,25 @@ class ConversionService:
         progress_callback: Optional[Callable[[int], None]] = None
     ) -> bool:
         """Convert video file to MP4 with optimized settings."""
+        with self._active_jobs_lock:
+            self.active_jobs += 1
         try:
-            print(f"Starting video conversion: {file_info.file_path} -> {output_path}")
-            print(f"Quality: {options.quality.value}, Fast mode: {options.fast_mode}")
-            
-            # Create FFmpeg input stream
-            input_stream = ffmpeg.input(str(file_info.file_path))
+            return self._run_video_conversion(file_info, options, output_path, progress_callback)
+        finally:
+            with self._active_jobs_lock:
+                self.active_jobs -= 1
+    
+    def _run_video_conversion(
+        self,
+        file_info: FileInfo,
+        options,
+        output_path: str,
+        progress_callback: Optional[Callable[[int], None]] = None
+    ) -> bool:
+        """Run the video conversion (see _convert_video)."""
+        try:
+            logger.debug("Starting video conversion: %s -> %s", file_info.file_path, output_path)
+            logger.debug("Quality: %s, Fast mode: %s", options.quality.value, options.fast_mode)
             
             # Get optimized settings based on quality preset
             video_settings = self._get_optimized_video_settings(
@@ -277,7 +427,10 @@ class ConversionService:
                 options.fast_mode
             )
             
-            print(f"Video settings: {video_settings}")
+            logger.debug("Video settings: %s", video_settings)
+            
+            # Create FFmpeg input stream (with hardware decoding when available)
+            input_stream = ffmpeg.input(str(file_info.file_path), **video_settings.get('input_args', {}))
             
             # Configure output with optimized settings
             output_stream = ffmpeg.output(
@@ -290,30 +443,38 @@ class ConversionService:
                 **video_settings['global_args']
             )
             
-            # Run conversion (simplified for now)
+            # Run conversion
             try:
-                print("Running FFmpeg conversion...")
-                ffmpeg.run(output_stream, overwrite_output=True, quiet=True)
-                print("FFmpeg conversion completed successfully")
+                logger.debug("Running FFmpeg conversion...")
                 if progress_callback:
-                    progress_callback(100)
+                    # The duration is probed here on the worker thread (once per file),
+                    # so loading a file never waits on ffprobe
+                    self._run_ffmpeg_with_progress(
+                        output_stream, output_path, progress_callback, file_info.duration
+                    )
+                else:
+                    self._run_ffmpeg(output_stream, output_path)
+                logger.debug("FFmpeg conversion completed successfully")
             except Exception as e:
-                print(f"FFmpeg conversion error: {e}")
-                print("Trying fallback conversion...")
+                if self._stopped:
+                    # Killed by shutdown(); don't start the fallback encode
+                    return False
+                logger.warning("FFmpeg conversion error: %s", e)
+                if getattr(e, 'stderr', None):
+                    logger.warning("FFmpeg output:\n%s", e.stderr.decode(errors='replace'))
+                logger.debug("Trying fallback conversion...")
                 # Try with more basic settings
                 self._fallback_video_conversion(file_info, output_path, options)
             
             return True
         except Exception as e:
-            print(f"Video conversion error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Video conversion error: %s", e)
             return False
     
     def _fallback_video_conversion(self, file_info: FileInfo, output_path: str, options):
         """Fallback video conversion with basic settings."""
         try:
-            print("Trying fallback video conversion...")
+            logger.debug("Trying fallback video conversion...")
             
             # Simple conversion with basic settings
             input_stream = ffmpeg.input(str(file_info.file_path))
@@ -328,21 +489,21 @@ class ConversionService:
                 crf='28'
             )
             
-            ffmpeg.run(output_stream, overwrite_output=True, quiet=True)
-            print("Fallback conversion successful")
+            self._run_ffmpeg(output_stream, output_path)
+            logger.debug("Fallback conversion successful")
             
         except Exception as e:
-            print(f"Fallback conversion also failed: {e}")
+            logger.error("Fallback conversion also failed: %s", e)
             raise e
     
     def _get_optimized_video_settings(self, quality: str, fast_mode: bool = True) -> dict:
         """Get optimized FFmpeg settings for video conversion."""
-        # Check for hardware acceleration support
-        hw_accel = self._detect_hardware_acceleration()
+        hw_accel = self.hw_accel
         
         # Choose preset based on fast mode
         preset = 'ultrafast' if fast_mode else 'fast'
         crf = '30' if fast_mode else '28'  # Higher CRF = faster encoding
+        threads = str(self._compute_thread_budget())
         
         settings = {
             '480p': {
@@ -358,7 +519,7 @@ class ConversionService:
                     'ab': '128k'
                 },
                 'global_args': {
-                    'threads': '0'
+                    'threads': threads
                 }
             },
             '720p': {
@@ -374,7 +535,7 @@ class ConversionService:
                     'ab': '128k'
                 },
                 'global_args': {
-                    'threads': '0'
+                    'threads': threads
                 }
             },
             '1080p': {
@@ -390,7 +551,7 @@ class ConversionService:
                     'ab': '192k'
                 },
                 'global_args': {
-                    'threads': '0'
+                    'threads': threads
                 }
             },
             'original': {
@@ -405,7 +566,7 @@ class ConversionService:
                     'ab': '192k'
                 },
                 'global_args': {
-                    'threads': '0'
+                    'threads': threads
                 }
             }
         }
@@ -415,81 +576,167 @@ class ConversionService:
             for quality_setting in settings.values():
                 if hw_accel['type'] == 'nvenc':
                     quality_setting['vcodec'] = 'h264_nvenc'
-                    quality_setting['video_args']['preset'] = 'fast'
-                    quality_setting['video_args']['tune'] = 'hq'
+                    # NVENC ignores CRF; use constant-quality VBR with the p1-p7 presets
+                    quality_setting['video_args'].pop('crf', None)
+                    quality_setting['video_args'].update({
+                        'preset': 'p4',
+                        'tune': 'hq',
+                        'rc': 'vbr',
+                        'cq': '23',
+                        'b:v': '0'
+                    })
+                    # Decode on the GPU too, keeping frames in CUDA memory for the encoder
+                    quality_setting['input_args'] = {'hwaccel': 'cuda', 'hwaccel_output_format': 'cuda'}
+                    if 'vf' in quality_setting['video_args']:
+                        quality_setting['video_args']['vf'] = quality_setting['video_args']['vf'].replace(
+                            'scale=', 'scale_cuda='
+                        )
                 elif hw_accel['type'] == 'qsv':
                     quality_setting['vcodec'] = 'h264_qsv'
-                    quality_setting['video_args']['preset'] = 'fast'
+                    quality_setting['video_args'].pop('crf', None)
+                    quality_setting['video_args'].update({
+                        'preset': 'medium',
+                        'global_quality': '23',
+                        'look_ahead': '1'
+                    })
                 elif hw_accel['type'] == 'vaapi':
                     quality_setting['vcodec'] = 'h264_vaapi'
                     quality_setting['video_args']['vaapi_device'] = hw_accel['device']
         
         return settings.get(quality, settings['original'])
     
+    def _compute_thread_budget(self) -> int:
+        """Split the CPU cores between the video conversions currently running."""
+        # FFmpeg's own default (threads=0) oversubscribes when several encodes run at once
+        cpu_count = os.cpu_count() or 1
+        return min(cpu_count, max(2, cpu_count // max(1, self.active_jobs)))
+    
     def _detect_hardware_acceleration(self):
         """Detect available hardware acceleration."""
+        encoders = self._list_encoders()
+        if encoders is None:
+            return {'type': 'software', 'available': False}
+        
+        if 'h264_nvenc' in encoders:
+            return {'type': 'nvenc', 'available': True}
+        elif 'h264_qsv' in encoders:
+            return {'type': 'qsv', 'available': True}
+        elif 'h264_vaapi' in encoders and os.path.exists(VAAPI_DEVICE):
+            return {'type': 'vaapi', 'device': VAAPI_DEVICE, 'available': True}
+        return {'type': 'software', 'available': False}
+    
+    def _list_encoders(self):
+        """Get the set of encoder names FFmpeg supports, or None if it can't be listed."""
+        # Listings are cached per FFmpeg binary; a new or updated binary is re-probed
+        cache_key = None
+        try:
+            ffmpeg_binary = shutil.which(self.ffmpeg_path) or os.path.abspath(self.ffmpeg_path)
+            cache_key = f"{ffmpeg_binary}:{os.path.getmtime(ffmpeg_binary)}"
+            with open(HW_ACCEL_CACHE_FILE, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get('key') == cache_key:
+                return set(cache['encoders'])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+        
         try:
-            import subprocess
-            result = subprocess.run([self.ffmpeg_path, '-encoders'], 
+            result = subprocess.run([self.ffmpeg_path, '-hide_banner', '-encoders'], 
                                   capture_output=True, text=True, timeout=10)
-            
-            if 'h264_nvenc' in result.stdout:
-                return {'type': 'nvenc', 'available': True}
-            elif 'h264_qsv' in result.stdout:
-                return {'type': 'qsv', 'available': True}
-            elif 'h264_vaapi' in result.stdout:
-                return {'type': 'vaapi', 'device': '/dev/dri/renderD128', 'available': True}
         except Exception:
-            pass
+            # Don't cache a failed probe
+            return None
         
-        return {'type': 'software', 'available': False}
+        # Encoder listing lines look like " V....D h264_nvenc  NVIDIA NVENC ..."
+        encoders = {
+            fields[1] for fields in (line.split() for line in result.stdout.splitlines())
+            if len(fields) > 1
+        }
+        
+        if cache_key:
+            try:
+                HW_ACCEL_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                with open(HW_ACCEL_CACHE_FILE, 'w', encoding='utf-8') as f:
+                    json.dump({'key': cache_key, 'encoders': sorted(encoders)}, f)
+            except OSError:
+                pass
+        
+        return encoders
     
-    def _run_ffmpeg_with_progress(self, output_stream, progress_callback):
-        """Run FFmpeg with progress tracking."""
+    def shutdown(self):
+        """Kill running FFmpeg processes and refuse to start new ones (for app exit)."""
+        with self._processes_lock:
+            self._stopped = True
+            processes = list(self._processes)
+        for process in processes:
+            process.kill()
+    
+    @contextlib.contextmanager
+    def _ffmpeg_process(self, args, output_path: str, **popen_kwargs):
+        """Start FFmpeg, tracking the process while it runs so shutdown() can kill it."""
+        with self._processes_lock:
+            if self._stopped:
+                raise RuntimeError("Conversion service has been shut down")
+            process = subprocess.Popen(args, stdin=subprocess.DEVNULL, **popen_kwargs)
+            self._processes.add(process)
         try:
-            # Get input file path for duration calculation
-            input_path = None
-            for stream in output_stream.inputs:
-                if hasattr(stream, 'url'):
-                    input_path = str(stream.url)
-                    break
-            
-            duration = 0
-            if input_path:
-                try:
-                    probe = ffmpeg.probe(input_path)
-                    duration = float(probe['streams'][0].get('duration', 0))
-                except Exception:
-                    duration = 0
-            
-            # Run FFmpeg with progress
-            process = ffmpeg.run_async(
-                output_stream,
-                overwrite_output=True,
-                pipe_stdout=True,
-                pipe_stderr=True
-            )
-            
-            # Monitor progress
-            import time
-            start_time = time.time()
-            
-            while process.poll() is None:
-                elapsed = time.time() - start_time
-                if duration > 0:
-                    # Estimate progress based on time
-                    estimated_progress = min(int((elapsed / (duration * 0.1)) * 100), 95)
-                else:
-                    # Fallback progress estimation
-                    estimated_progress = min(int((elapsed / 30) * 100), 95)
-                
-                progress_callback(estimated_progress)
-                time.sleep(0.5)
-            
-            # Final progress
-            progress_callback(100)
+            yield process
+        finally:
+            if process.poll() is None:
+                process.kill()
+            process.wait()
+            with self._processes_lock:
+                self._processes.discard(process)
+            # Don't leave a truncated output behind after shutdown() killed the encode
+            if self._stopped and process.returncode != 0:
+                with contextlib.suppress(OSError):
+                    os.remove(output_path)
+    
+    def _run_ffmpeg(self, output_stream, output_path: str):
+        """Run FFmpeg to completion (like ffmpeg.run(..., quiet=True), but killable)."""
+        args = output_stream.compile(overwrite_output=True)
+        with self._ffmpeg_process(
+            args, output_path, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+        ) as process:
+            _, stderr = process.communicate()
+        
+        if process.returncode != 0:
+            raise ffmpeg.Error('ffmpeg', None, stderr)
+    
+    def _run_ffmpeg_with_progress(
+        self,
+        output_stream,
+        output_path: str,
+        progress_callback,
+        duration: Optional[float] = None
+    ):
+        """Run FFmpeg with progress tracking."""
+        # -progress writes key=value blocks to stdout; out_time_us is the position encoded so far
+        args = output_stream.global_args('-progress', 'pipe:1', '-nostats').compile(overwrite_output=True)
+        duration_us = (duration or 0) * 1000000
+        
+        with self._ffmpeg_process(
+            args, output_path, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        ) as process:
+            # Drain stderr alongside the progress reads (a full pipe would stall FFmpeg),
+            # keeping only its tail for the error
+            stderr_tail = collections.deque(maxlen=FFMPEG_STDERR_TAIL_LINES)
+            stderr_reader = threading.Thread(target=stderr_tail.extend, args=(process.stderr,), daemon=True)
+            stderr_reader.start()
             
-        except Exception as e:
-            print(f"Progress tracking error: {e}")
-            # Fallback to regular conversion
-            ffmpeg.run(output_stream, overwrite_output=True, quiet=True)
+            last_progress = -1
+            for line in process.stdout:
+                key, _, value = line.strip().partition('=')
+                if key == 'out_time_us' and duration_us > 0 and value.isdigit():
+                    # Hold back 100 until FFmpeg has exited successfully
+                    progress = min(int(int(value) * 100 / duration_us), 99)
+                    if progress != last_progress:
+                        progress_callback(progress)
+                        last_progress = progress
+            process.wait()
+            stderr_reader.join()
+        
+        if process.returncode != 0:
+            raise ffmpeg.Error('ffmpeg', None, ''.join(stderr_tail).encode())
+        
+        # Final progress
+        progress_callback(100)
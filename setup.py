@@ -5,8 +5,10 @@ Installs dependencies and sets up the environment.
 
 import os
 import sys
+import argparse
 import subprocess
 import platform
+import shutil
 from pathlib import Path
 
 
@@ -36,17 +38,62 @@ def install_dependencies():
         return False
 
 
+def install_pillow_simd():
+    """
+    Replace stock Pillow with Pillow-SIMD (SSE4/AVX2 resize and encode paths).
+    
+    Returns True if Pillow-SIMD was installed, None if stock Pillow was kept
+    instead, and False if no working Pillow is left installed.
+    """
+    if platform.machine().lower() not in ('x86_64', 'amd64'):
+        print("✗ Pillow-SIMD needs an x86-64 CPU, keeping stock Pillow")
+        return None
+    
+    print("Installing Pillow-SIMD (builds from source, needs a C compiler)...")
+    try:
+        subprocess.check_call([sys.executable, '-m', 'pip', 'uninstall', '-y', 'Pillow'])
+        subprocess.check_call([
+            sys.executable, '-m', 'pip', 'install', '--force-reinstall', 'Pillow-SIMD'
+        ])
+        print("✓ Pillow-SIMD installed successfully")
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"✗ Failed to install Pillow-SIMD: {e}")
+        print("Restoring stock Pillow...")
+        try:
+            subprocess.check_call([sys.executable, '-m', 'pip', 'install', 'Pillow>=9.0.0'])
+            print("✓ Stock Pillow restored")
+            return None
+        except subprocess.CalledProcessError as e:
+            print(f"✗ Failed to restore Pillow: {e}")
+            return False
+
+
+def check_pillow_build():
+    """Report which Pillow build is installed."""
+    try:
+        result = subprocess.run(
+            [sys.executable, '-c', 'import PIL; print(PIL.__version__)'],
+            capture_output=True, text=True, check=True, timeout=30
+        )
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+        print("✗ Pillow could not be imported")
+        return
+    
+    version = result.stdout.strip()
+    # Pillow-SIMD releases carry a .postN suffix on the Pillow version they track
+    build = "Pillow-SIMD" if '.post' in version else "stock Pillow"
+    print(f"✓ Pillow {version} detected ({build})")
+
+
 def check_ffmpeg():
     """Check if FFmpeg is available."""
     print("Checking for FFmpeg...")
     
-    # Check if ffmpeg is in PATH
-    try:
-        subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True, timeout=10)
+    # Check if ffmpeg is in PATH (pure path lookup, no process spawn)
+    if shutil.which('ffmpeg'):
         print("✓ FFmpeg found in system PATH")
         return True
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-        pass
     
     # Check for bundled ffmpeg.exe
     possible_paths = [
@@ -101,8 +148,20 @@ python3 main.py
         print("✓ Created launcher script: run_formatfusion.sh")
 
 
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Set up the FormatFusion environment.")
+    parser.add_argument(
+        '--pillow-simd',
+        action='store_true',
+        help="replace Pillow with the SIMD-accelerated Pillow-SIMD build (x86-64 only)"
+    )
+    return parser.parse_args()
+
+
 def main():
     """Main setup process."""
+    args = parse_args()
     print("FormatFusion Setup")
     print("=" * 20)
     
@@ -117,6 +176,15 @@ def main():
     if not install_dependencies():
         return False
     
+    # Optionally switch to the SIMD build of Pillow
+    pillow_simd_skipped = False
+    if args.pillow_simd:
+        pillow_simd = install_pillow_simd()
+        if pillow_simd is False:
+            return False
+        pillow_simd_skipped = pillow_simd is None
+    check_pillow_build()
+    
     # Check FFmpeg
     ffmpeg_available = check_ffmpeg()
     
@@ -137,6 +205,9 @@ def main():
         print("Setup completed with warnings!")
         print("Please install FFmpeg and run this script again.")
     
+    if pillow_simd_skipped:
+        print("\nNote: --pillow-simd was not applied; stock Pillow is installed.")
+    
     return ffmpeg_available
 
 
@@ -4,28 +4,76 @@ Utility functions for file operations.
 
 import os
 import shutil
+import sys
+import functools
+import logging
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
+from config import LOGO_CACHE_FILE, LOGO_PATHS
 
-def get_file_icon_path(file_extension: str) -> Optional[str]:
-    """Get icon path for file extension."""
-    icon_dir = Path("icons")
-    if not icon_dir.exists():
-        return None
-    
-    extension = file_extension.lower().lstrip('.')
-    icon_path = icon_dir / f"{extension}.ico"
+logger = logging.getLogger(__name__)
+
+# Maps each character that is invalid in filenames to '_'
+_SAFE_FILENAME_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+# Bytes per in-kernel copy call (progress is reported after each) and per buffered read
+COPY_CHUNK_SIZE = 64 * 1024 * 1024
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=None)
+def first_existing(paths: Tuple[str, ...]) -> Optional[str]:
+    """Return the first path in paths that exists, caching the result."""
+    return next((path for path in paths if os.path.exists(path)), None)
+
+
+@functools.lru_cache(maxsize=1)
+def get_logo_path() -> Optional[str]:
+    """Get the correct path for the logo file (None if there is none), resolved once per process."""
+    # Reuse the path found on a previous launch if it is still there
+    try:
+        cached_path = LOGO_CACHE_FILE.read_text(encoding='utf-8').strip()
+        if cached_path and os.path.exists(cached_path):
+            return cached_path
+    except OSError:
+        pass
     
-    if icon_path.exists():
-        return str(icon_path)
+    if getattr(sys, 'frozen', False):
+        # Running as PyInstaller executable
+        base_path = sys._MEIPASS
+    else:
+        # Running as script: the project root, one level above utils/
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     
-    # Default icon
-    default_icon = icon_dir / "default.ico"
-    if default_icon.exists():
-        return str(default_icon)
+    logo_paths = tuple(os.path.join(base_path, path) for path in LOGO_PATHS)
+    logo_paths += LOGO_PATHS  # Fallback for development
+    logo_path = first_existing(logo_paths)
     
-    return None
+    if logo_path:
+        logo_path = os.path.abspath(logo_path)
+        try:
+            LOGO_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            LOGO_CACHE_FILE.write_text(logo_path, encoding='utf-8')
+        except OSError:
+            pass
+    return logo_path
+
+
+@functools.lru_cache(maxsize=1)
+def _icon_paths() -> Dict[str, str]:
+    """Map lowercase icon names to paths, from a single listing of the icons directory."""
+    icon_dir = Path("icons")
+    if not icon_dir.is_dir():
+        return {}
+    return {icon_path.stem.lower(): str(icon_path) for icon_path in icon_dir.glob("*.ico")}
+
+
+def get_file_icon_path(file_extension: str) -> Optional[str]:
+    """Get icon path for file extension."""
+    icons = _icon_paths()
+    # Fall back to the default icon
+    return icons.get(file_extension.lower().lstrip('.')) or icons.get("default")
 
 
 def ensure_directory_exists(path: str) -> bool:
@@ -39,10 +87,7 @@ def ensure_directory_exists(path: str) -> bool:
 
 def get_safe_filename(filename: str) -> str:
     """Get a safe filename by removing invalid characters."""
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
-    return filename
+    return filename.translate(_SAFE_FILENAME_TABLE)
 
 
 def get_unique_filename(file_path: str) -> str:
@@ -51,12 +96,87 @@ def get_unique_filename(file_path: str) -> str:
     if not path.exists():
         return file_path
     
-    counter = 1
-    while True:
-        new_path = path.parent / f"{path.stem}_{counter}{path.suffix}"
-        if not new_path.exists():
-            return str(new_path)
-        counter += 1
+    def candidate(counter: int) -> Path:
+        return path.parent / f"{path.stem}_{counter}{path.suffix}"
+    
+    # Exponential search for a free counter, then binary search back down to a free
+    # counter right after a taken one (O(log N) stat calls, not O(N)). When the taken
+    # counters are contiguous this is the first free one; with gaps it may be a later
+    # free counter (e.g. _5 rather than _3 when _1, _2 and _4 exist), never a taken one
+    low, high = 0, 1
+    while candidate(high).exists():
+        low, high = high, high * 2
+    
+    while high - low > 1:
+        middle = (low + high) // 2
+        if candidate(middle).exists():
+            low = middle
+        else:
+            high = middle
+    
+    return str(candidate(high))
+
+
+def _copy_with_kernel(src_path: Path, dst_path: Path, progress_callback=None) -> None:
+    """Copy file contents in chunks with copy_file_range/sendfile, falling back to buffered reads."""
+    with open(src_path, 'rb') as fsrc, open(dst_path, 'wb') as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        copied = 0
+        # copy_file_range can reflink on copy-on-write filesystems; sendfile stays in the kernel
+        for copy in (getattr(os, 'copy_file_range', None), getattr(os, 'sendfile', None)):
+            if copy is None:
+                continue
+            try:
+                fdst.seek(copied)
+                while copied < size:
+                    count = min(COPY_CHUNK_SIZE, size - copied)
+                    if copy is os.sendfile:
+                        written = os.sendfile(fdst.fileno(), fsrc.fileno(), copied, count)
+                    else:
+                        written = copy(fsrc.fileno(), fdst.fileno(), count, copied, copied)
+                    if written == 0:
+                        break
+                    copied += written
+                    if progress_callback:
+                        progress_callback(copied * 100 // size)
+                if copied >= size:
+                    return
+            except OSError:
+                pass
+        
+        # Portable fallback: large buffered reads, resuming after any kernel-copied prefix
+        fsrc.seek(copied)
+        fdst.seek(copied)
+        fdst.truncate()
+        while True:
+            chunk = fsrc.read(COPY_BUFFER_SIZE)
+            if not chunk:
+                break
+            fdst.write(chunk)
+            copied += len(chunk)
+            if progress_callback and size:
+                progress_callback(copied * 100 // size)
+
+
+def _copy_with_copyfileex(src_path: Path, dst_path: Path, progress_callback=None) -> None:
+    """Copy a file with Windows' CopyFileExW, reporting its progress callbacks."""
+    import ctypes
+    from ctypes import wintypes
+    
+    progress_routine_type = ctypes.WINFUNCTYPE(
+        wintypes.DWORD,
+        ctypes.c_longlong, ctypes.c_longlong, ctypes.c_longlong, ctypes.c_longlong,
+        wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE, wintypes.HANDLE, wintypes.LPVOID
+    )
+    
+    def progress_routine(total_size, transferred, *_):
+        if progress_callback and total_size:
+            progress_callback(int(transferred * 100 // total_size))
+        return 0  # PROGRESS_CONTINUE
+    
+    routine = progress_routine_type(progress_routine)
+    if not ctypes.windll.kernel32.CopyFileExW(str(src_path), str(dst_path), routine, None, None, 0):
+        raise ctypes.WinError()
 
 
 def copy_file_with_progress(src: str, dst: str, progress_callback=None) -> bool:
@@ -68,13 +188,17 @@ def copy_file_with_progress(src: str, dst: str, progress_callback=None) -> bool:
         # Ensure destination directory exists
         dst_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Copy file
-        shutil.copy2(src_path, dst_path)
+        # Copy file (CopyFileExW keeps metadata itself; elsewhere copy it like copy2)
+        if sys.platform == 'win32':
+            _copy_with_copyfileex(src_path, dst_path, progress_callback)
+        else:
+            _copy_with_kernel(src_path, dst_path, progress_callback)
+            shutil.copystat(src_path, dst_path)
         
         if progress_callback:
             progress_callback(100)
         
         return True
     except Exception as e:
-        print(f"File copy error: {e}")
+        logger.error("File copy error: %s", e)
         return False
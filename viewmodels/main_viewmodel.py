@@ -3,41 +3,126 @@ Main ViewModel for FormatFusion application.
 Handles business logic and state management.
 """
 
-from PyQt6.QtCore import QObject, pyqtSignal, QThread, pyqtSlot
+import queue
+import time
+from contextlib import contextmanager
+
+from PyQt6.QtCore import QCoreApplication, QObject, pyqtSignal, QThread, pyqtSlot
 from PyQt6.QtWidgets import QFileDialog
 from pathlib import Path
 
+from config import SUPPORTED_IMAGE_EXTENSIONS, SUPPORTED_AUDIO_EXTENSIONS, SUPPORTED_VIDEO_EXTENSIONS
 from models.file_info import FileInfo, FileType
 from models.conversion_options import ConversionOptions, ImageConversionOptions, AudioConversionOptions, VideoConversionOptions
 from models.conversion_options import ImageFormat, AudioQuality, VideoQuality
 from services.conversion_service import ConversionService
 
 
+def _dialog_patterns(extensions) -> str:
+    """Build a file dialog pattern list like "*.png *.jpg" from extensions."""
+    return " ".join(f"*{extension}" for extension in sorted(extensions))
+
+
+# File dialog filter, built once from the same extension sets FileInfo detects with
+_FILE_DIALOG_FILTER = ";;".join((
+    "All Files (*.*)",
+    f"Images ({_dialog_patterns(SUPPORTED_IMAGE_EXTENSIONS)})",
+    f"Audio ({_dialog_patterns(SUPPORTED_AUDIO_EXTENSIONS)})",
+    f"Video ({_dialog_patterns(SUPPORTED_VIDEO_EXTENSIONS)})",
+))
+
+
+# Option value -> enum member, so updates skip the Enum constructor's lookup
+_IMAGE_FORMATS = {member.value: member for member in ImageFormat}
+_AUDIO_QUALITIES = {member.value: member for member in AudioQuality}
+_VIDEO_QUALITIES = {member.value: member for member in VideoQuality}
+
+
+# File type -> output extension for get_output_filename()
+_OUTPUT_EXTENSION_FOR_TYPE = {
+    FileType.IMAGE: lambda viewmodel: (
+        viewmodel.conversion_options.image_options.output_format.value
+        if viewmodel.conversion_options and viewmodel.conversion_options.image_options
+        else "png"
+    ),
+    FileType.AUDIO: lambda viewmodel: "mp3",
+    FileType.VIDEO: lambda viewmodel: "mp4",
+}
+
+
+# Shortest interval between progress signals (~30 per second); 100% is always sent
+PROGRESS_EMIT_INTERVAL_NS = 33000000
+
+
 class ConversionWorker(QThread):
-    """Worker thread for file conversion."""
+    """Long-lived worker thread that converts queued jobs one after another."""
     
     progress_updated = pyqtSignal(int)
-    conversion_finished = pyqtSignal(bool, str)
+    conversion_succeeded = pyqtSignal(str)  # output path
+    conversion_failed = pyqtSignal(str)  # error message (the output path if the service just failed)
     
-    def __init__(self, file_info, options, output_path, conversion_service):
+    def __init__(self, conversion_service):
         super().__init__()
-        self.file_info = file_info
-        self.options = options
-        self.output_path = output_path
         self.conversion_service = conversion_service
+        # (file_info, options, output_path) jobs; None stops the thread
+        self._jobs = queue.Queue()
+        self._last_emit_ns = 0
+    
+    def enqueue(self, file_info, options, output_path):
+        """Queue a conversion job."""
+        self._jobs.put((file_info, options, output_path))
+    
+    def cancel_pending(self) -> int:
+        """Drop queued jobs that haven't started; returns how many were dropped."""
+        dropped = 0
+        while True:
+            try:
+                job = self._jobs.get_nowait()
+            except queue.Empty:
+                return dropped
+            if job is None:
+                # Keep a pending stop request
+                self._jobs.put(None)
+                return dropped
+            dropped += 1
+            self.conversion_failed.emit("Cancelled")
+    
+    def stop(self):
+        """Finish the current job, then end the thread."""
+        self._jobs.put(None)
+        self.wait()
+    
+    def _emit_progress(self, percent: int):
+        """Forward progress to the UI at most every PROGRESS_EMIT_INTERVAL_NS."""
+        now = time.monotonic_ns()
+        if percent >= 100 or now - self._last_emit_ns >= PROGRESS_EMIT_INTERVAL_NS:
+            self._last_emit_ns = now
+            self.progress_updated.emit(percent)
     
     def run(self):
-        """Run conversion in background thread."""
-        try:
-            success = self.conversion_service.convert_file(
-                self.file_info,
-                self.options,
-                self.output_path,
-                self.progress_updated.emit
-            )
-            self.conversion_finished.emit(success, self.output_path)
-        except Exception as e:
-            self.conversion_finished.emit(False, str(e))
+        """Run queued conversions in the background thread."""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            
+            file_info, options, output_path = job
+            self._last_emit_ns = 0
+            try:
+                success = self.conversion_service.convert_file(
+                    file_info,
+                    options,
+                    output_path,
+                    self._emit_progress
+                )
+            except Exception as e:
+                self.conversion_failed.emit(str(e))
+                continue
+            
+            if success:
+                self.conversion_succeeded.emit(output_path)
+            else:
+                self.conversion_failed.emit(output_path)
 
 
 class MainViewModel(QObject):
@@ -49,15 +134,36 @@ class MainViewModel(QObject):
     conversion_options_changed = pyqtSignal()
     conversion_started = pyqtSignal()
     conversion_progress = pyqtSignal(int)
-    conversion_finished = pyqtSignal(bool, str)
     status_message = pyqtSignal(str)
     
     def __init__(self):
         super().__init__()
         self.current_file: FileInfo = None
+        # Directory of current_file, computed once per load for get_output_filename()
+        self._input_dir: Path = None
         self.conversion_options: ConversionOptions = None
         self.conversion_service = ConversionService()
-        self.conversion_worker: ConversionWorker = None
+        self._conversion_in_flight = False
+        
+        # One worker thread for the app's lifetime; conversions are queued to it
+        self.conversion_worker = ConversionWorker(self.conversion_service)
+        # Signal-to-signal connection: Qt relays progress itself, without a Python slot
+        self.conversion_worker.progress_updated.connect(self.conversion_progress)
+        # Connected before any view slot, so the in-flight flag is cleared first
+        self.conversion_worker.conversion_succeeded.connect(self._on_conversion_succeeded)
+        self.conversion_worker.conversion_failed.connect(self._on_conversion_failed)
+        self.conversion_worker.start()
+        
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+        
+        # Nesting depth of batch_option_updates() and whether a change is waiting to be emitted
+        self._batch_depth = 0
+        self._pending_options_changed = False
+        
+        # (key, filename, suffix) of the last get_output_filename() result
+        self._output_name_cache = None
         
         # Initialize default options
         self._initialize_default_options()
@@ -74,42 +180,79 @@ class MainViewModel(QObject):
                 self.status_message.emit(f"Unsupported file type: {file_info.extension}")
                 return False
             
-            self.current_file = file_info
-            self.conversion_options = ConversionOptions(file_info.file_type)
-            self.file_loaded.emit(file_info)
-            self.conversion_options_changed.emit()
-            self.status_message.emit(f"File loaded: {file_info.filename}{file_info.extension}")
-            return True
+            conversion_options = ConversionOptions(file_info.file_type)
         except Exception as e:
             self.status_message.emit(f"Error loading file: {str(e)}")
             return False
+        
+        # Commit all state before notifying, and let the trailing options signal
+        # cover any option updates made by file_loaded slots
+        self.current_file = file_info
+        self._input_dir = file_info.file_path.parent
+        self.conversion_options = conversion_options
+        self._output_name_cache = None
+        with self.batch_option_updates():
+            self.file_loaded.emit(file_info)
+            self._emit_options_changed()
+        self.status_message.emit(f"File loaded: {file_info.filename}{file_info.extension}")
+        return True
     
     def clear_file(self):
         """Clear current file and reset state."""
         self.current_file = None
+        self._input_dir = None
         self.conversion_options = None
-        self.file_cleared.emit()
-        self.conversion_options_changed.emit()
+        self._output_name_cache = None
+        with self.batch_option_updates():
+            self.file_cleared.emit()
+            self._emit_options_changed()
         self.status_message.emit("Ready")
     
+    @contextmanager
+    def batch_option_updates(self):
+        """Group several option updates so conversion_options_changed is emitted once."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending_options_changed:
+                self._pending_options_changed = False
+                self.conversion_options_changed.emit()
+    
+    @property
+    def conversion_succeeded(self):
+        """The worker's conversion_succeeded(output_path) signal, for views to connect to."""
+        return self.conversion_worker.conversion_succeeded
+    
+    @property
+    def conversion_failed(self):
+        """The worker's conversion_failed(message) signal, for views to connect to."""
+        return self.conversion_worker.conversion_failed
+    
+    def _emit_options_changed(self):
+        """Emit conversion_options_changed, or defer it while a batch is open."""
+        self._output_name_cache = None
+        if self._batch_depth:
+            self._pending_options_changed = True
+        else:
+            self.conversion_options_changed.emit()
+    
     def select_file(self) -> str:
         """Open file dialog to select a file."""
-        file_dialog = QFileDialog()
-        file_path, _ = file_dialog.getOpenFileName(
+        file_path, _ = QFileDialog.getOpenFileName(
             None,
             "Select File to Convert",
             "",
-            "All Files (*.*);;Images (*.png *.jpg *.jpeg *.bmp *.tiff *.gif *.webp);;"
-            "Audio (*.wav *.m4a *.flac *.ogg *.mp3 *.aac *.wma);;"
-            "Video (*.mkv *.mov *.avi *.webm *.flv *.mp4 *.wmv *.m4v)"
+            _FILE_DIALOG_FILTER
         )
         return file_path
     
     def update_image_format(self, format_value: str):
         """Update image output format."""
         if self.conversion_options and self.conversion_options.image_options:
-            self.conversion_options.image_options.output_format = ImageFormat(format_value)
-            self.conversion_options_changed.emit()
+            self.conversion_options.image_options.output_format = _IMAGE_FORMATS[format_value]
+            self._emit_options_changed()
     
     def update_image_resize(self, enabled: bool, max_width: int = None, max_height: int = None):
         """Update image resize options."""
@@ -118,7 +261,7 @@ class MainViewModel(QObject):
             if enabled:
                 self.conversion_options.image_options.max_width = max_width
                 self.conversion_options.image_options.max_height = max_height
-            self.conversion_options_changed.emit()
+            self._emit_options_changed()
     
     def update_image_size_limit(self, enabled: bool, max_size_kb: int = None):
         """Update image size limit options."""
@@ -126,25 +269,39 @@ class MainViewModel(QObject):
             self.conversion_options.image_options.size_limit_enabled = enabled
             if enabled:
                 self.conversion_options.image_options.max_size_kb = max_size_kb
-            self.conversion_options_changed.emit()
+            self._emit_options_changed()
+    
+    def update_image_options(self, format_value: str, resize_enabled: bool, max_width: int = None,
+                             max_height: int = None, size_limit_enabled: bool = False, max_size_kb: int = None):
+        """Update all image options, emitting conversion_options_changed once."""
+        with self.batch_option_updates():
+            self.update_image_format(format_value)
+            self.update_image_resize(resize_enabled, max_width, max_height)
+            self.update_image_size_limit(size_limit_enabled, max_size_kb)
     
     def update_audio_quality(self, quality_value: str):
         """Update audio quality setting."""
         if self.conversion_options and self.conversion_options.audio_options:
-            self.conversion_options.audio_options.quality = AudioQuality(quality_value)
-            self.conversion_options_changed.emit()
+            self.conversion_options.audio_options.quality = _AUDIO_QUALITIES[quality_value]
+            self._emit_options_changed()
     
     def update_video_quality(self, quality_value: str):
         """Update video quality setting."""
         if self.conversion_options and self.conversion_options.video_options:
-            self.conversion_options.video_options.quality = VideoQuality(quality_value)
-            self.conversion_options_changed.emit()
+            self.conversion_options.video_options.quality = _VIDEO_QUALITIES[quality_value]
+            self._emit_options_changed()
     
     def update_video_fast_mode(self, fast_mode: bool):
         """Update video fast mode setting."""
         if self.conversion_options and self.conversion_options.video_options:
             self.conversion_options.video_options.fast_mode = fast_mode
-            self.conversion_options_changed.emit()
+            self._emit_options_changed()
+    
+    def update_video_options(self, quality_value: str, fast_mode: bool):
+        """Update all video options, emitting conversion_options_changed once."""
+        with self.batch_option_updates():
+            self.update_video_quality(quality_value)
+            self.update_video_fast_mode(fast_mode)
     
     def can_convert(self) -> bool:
         """Check if conversion can be performed."""
@@ -158,53 +315,71 @@ class MainViewModel(QObject):
             self.status_message.emit("Cannot convert: Invalid file or options")
             return
         
-        if self.conversion_worker and self.conversion_worker.isRunning():
+        if self._conversion_in_flight:
             self.status_message.emit("Conversion already in progress")
             return
         
-        self.conversion_worker = ConversionWorker(
-            self.current_file,
-            self.conversion_options,
-            output_path,
-            self.conversion_service
-        )
-        
-        self.conversion_worker.progress_updated.connect(self.conversion_progress.emit)
-        self.conversion_worker.conversion_finished.connect(self._on_conversion_finished)
-        
-        self.conversion_worker.start()
+        self._conversion_in_flight = True
+        self.conversion_worker.enqueue(self.current_file, self.conversion_options, output_path)
         self.conversion_started.emit()
         self.status_message.emit("Converting file...")
     
-    @pyqtSlot(bool, str)
-    def _on_conversion_finished(self, success: bool, message: str):
-        """Handle conversion completion."""
-        if success:
-            self.status_message.emit("Conversion complete!")
-            self.conversion_finished.emit(True, message)
-        else:
-            self.status_message.emit(f"Conversion failed: {message}")
-            self.conversion_finished.emit(False, message)
+    def shutdown(self):
+        """Stop the conversion worker thread, killing any FFmpeg run in progress."""
+        if self.conversion_worker.isRunning():
+            # Drop the connections first: the cancelled and killed jobs below report
+            # failures that must not reach the view (and pop up dialogs) while quitting,
+            # and the stopped worker then holds no references back to us or the view
+            self.conversion_worker.progress_updated.disconnect()
+            self.conversion_worker.conversion_succeeded.disconnect()
+            self.conversion_worker.conversion_failed.disconnect()
+            self.conversion_worker.cancel_pending()
+            # Quitting mid-encode shouldn't hang the closed window until FFmpeg finishes
+            self.conversion_service.shutdown()
+            self.conversion_worker.stop()
+    
+    @pyqtSlot(str)
+    def _on_conversion_succeeded(self, output_path: str):
+        """Handle a successful conversion."""
+        self._conversion_in_flight = False
+        self.status_message.emit("Conversion complete!")
+    
+    @pyqtSlot(str)
+    def _on_conversion_failed(self, message: str):
+        """Handle a failed or cancelled conversion."""
+        self._conversion_in_flight = False
+        self.status_message.emit(f"Conversion failed: {message}")
     
     def get_output_filename(self) -> str:
         """Generate output filename based on current file and options."""
         if not self.current_file:
             return ""
         
+        image_options = self.conversion_options.image_options if self.conversion_options else None
+        cache_key = (
+            self.current_file.file_path,
+            self.current_file.file_type,
+            image_options.output_format if image_options else None
+        )
+        if self._output_name_cache and self._output_name_cache[0] == cache_key:
+            return self._output_name_cache[1]
+        
         base_name = self.current_file.filename
-        input_dir = self.current_file.file_path.parent
         
-        if self.current_file.file_type == FileType.IMAGE:
-            if self.conversion_options and self.conversion_options.image_options:
-                extension = self.conversion_options.image_options.output_format.value
-            else:
-                extension = "png"
-        elif self.current_file.file_type == FileType.AUDIO:
-            extension = "mp3"
-        elif self.current_file.file_type == FileType.VIDEO:
-            extension = "mp4"
+        extension_for = _OUTPUT_EXTENSION_FOR_TYPE.get(self.current_file.file_type)
+        if extension_for:
+            extension = extension_for(self)
         else:
             extension = self.current_file.extension[1:]  # Remove dot
         
         # Return full path in the same directory as input file
-        return str(input_dir / f"{base_name}_converted.{extension}")
+        output_filename = str(self._input_dir / f"{base_name}_converted.{extension}")
+        self._output_name_cache = (cache_key, output_filename, f".{extension}")
+        return output_filename
+    
+    def get_output_suffix(self) -> str:
+        """Get the suffix (e.g. ".png") of get_output_filename(), without re-parsing the path."""
+        if not self.get_output_filename():
+            return ""
+        return self._output_name_cache[2]
+
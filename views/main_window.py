@@ -3,23 +3,119 @@ Main window view for FormatFusion application.
 Implements the drag-and-drop interface and conversion controls.
 """
 
-import os
-from pathlib import Path
+import functools
+import logging
+import textwrap
+from typing import Optional, Tuple
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QComboBox, QCheckBox, QSpinBox, QProgressBar, QFileDialog, QGroupBox,
-    QGridLayout, QFrame, QSizePolicy, QMessageBox, QApplication
+    QGridLayout, QFrame, QSizePolicy, QMessageBox, QApplication, QStackedWidget
 )
-from PyQt6.QtCore import Qt, pyqtSlot, QMimeData, pyqtSignal
-from PyQt6.QtGui import QFont, QPixmap, QDragEnterEvent, QDropEvent, QIcon
+from PyQt6.QtCore import Qt, pyqtSlot, QMimeData, pyqtSignal, QTimer, QPoint
+from PyQt6.QtGui import QFont, QPixmap, QDragEnterEvent, QDropEvent, QIcon, QPalette, QColor, QPolygon
 
 from models.file_info import FileType
+from utils.file_utils import get_logo_path
 from viewmodels.main_viewmodel import MainViewModel
 
+logger = logging.getLogger(__name__)
+
+# Quiet period (ms) after the last option edit before options_changed is emitted
+OPTIONS_CHANGED_DEBOUNCE_MS = 50
+
+# File type -> icon shown in FileInfoWidget (anything else gets a generic document)
+_ICON_FOR_TYPE = {
+    FileType.IMAGE: "\U0001f5bc\ufe0f",  # framed picture
+    FileType.AUDIO: "\U0001f3b5",  # musical note
+    FileType.VIDEO: "\U0001f3ac",  # clapper board
+}
+
+# Arrowhead of the fallback app icon, drawn as one polyline through its tip
+_FALLBACK_ICON_ARROW_HEAD = QPolygon([QPoint(18, 12), QPoint(22, 16), QPoint(18, 20)])
+
+
+def _vbox(spacing: Optional[int] = None, margins: Optional[Tuple[int, int, int, int]] = None,
+          alignment: Optional[Qt.AlignmentFlag] = None) -> QVBoxLayout:
+    """Create a QVBoxLayout with its properties set up front, before any widget owns it."""
+    layout = QVBoxLayout()
+    if spacing is not None:
+        layout.setSpacing(spacing)
+    if margins is not None:
+        layout.setContentsMargins(*margins)
+    if alignment is not None:
+        layout.setAlignment(alignment)
+    return layout
+
+
+@functools.lru_cache(maxsize=1)
+def _logo_pixmap() -> Optional[QPixmap]:
+    """Decode the application logo once; None if there is no usable logo."""
+    logo_path = get_logo_path()
+    if not logo_path:
+        return None
+    
+    pixmap = QPixmap(logo_path)
+    if pixmap.isNull():
+        logger.warning("Error loading logo from %s", logo_path)
+        return None
+    logger.debug("Logo loaded from: %s", logo_path)
+    return pixmap
+
+
+@functools.lru_cache(maxsize=4)
+def _scaled_logo(size: int) -> Optional[QPixmap]:
+    """The logo smoothly scaled to fit size x size, scaled once per size; None if there is no logo."""
+    pixmap = _logo_pixmap()
+    if pixmap is None:
+        return None
+    return pixmap.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+
+
+@functools.lru_cache(maxsize=1)
+def _fallback_app_icon() -> QIcon:
+    """Paint the fallback app icon (used when there is no logo) once per process."""
+    from PyQt6.QtGui import QPainter, QBrush, QPen, QImage
+    
+    # Paint into a 32x32 QImage (plain CPU raster, no platform pixmap) and convert once at the end
+    image = QImage(32, 32, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    
+    # Draw a simple gear/convert icon
+    painter.setBrush(QBrush(Qt.GlobalColor.cyan))
+    painter.setPen(QPen(Qt.GlobalColor.white, 2))
+    painter.drawEllipse(4, 4, 24, 24)
+    
+    # Draw arrow; the shaft is horizontal, so it skips antialiasing (the diagonal head keeps it)
+    painter.setPen(QPen(Qt.GlobalColor.white, 3))
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+    painter.drawLine(10, 16, 22, 16)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.drawPolyline(_FALLBACK_ICON_ARROW_HEAD)
+    
+    painter.end()
+    
+    return QIcon(QPixmap.fromImage(image))
+
+
+@functools.lru_cache(maxsize=1)
+def app_icon() -> QIcon:
+    """The application icon, built once from the decoded logo (or the fallback icon)."""
+    pixmap = _logo_pixmap()
+    if pixmap is None:
+        return _fallback_app_icon()
+    return QIcon(pixmap)
+
 
 class ThemeManager:
     """Manages the application's dark theme with navy-blue colors."""
     
+    # Application the theme was last applied to
+    _themed_app = None
+    
     # Color palette
     COLORS = {
         'primary': '#1e3a8a',      # Navy blue
@@ -42,39 +138,34 @@ class ThemeManager:
         'pressed': '#475569',      # Pressed state
     }
     
-    @classmethod
-    def get_stylesheet(cls):
-        """Get the complete application stylesheet."""
-        return f"""
+    # Stylesheet with {color_name} placeholders for COLORS ({{ }} are literal braces),
+    # dedented once here so Qt's parser doesn't skip source indentation on every parse
+    _STYLESHEET_TEMPLATE = textwrap.dedent("""
         /* Main Application */
         QMainWindow {{
-            background-color: {cls.COLORS['background']};
-            color: {cls.COLORS['text_primary']};
+            background-color: {background};
+            color: {text_primary};
         }}
         
         /* Drag and Drop Area */
         DragDropArea {{
-            border: 3px dashed {cls.COLORS['border']};
+            border: 3px dashed {border};
             border-radius: 15px;
             background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                stop:0 {cls.COLORS['surface']}, 
-                stop:1 {cls.COLORS['surface_light']});
+                stop:0 {surface}, 
+                stop:1 {surface_light});
             min-height: 200px;
         }}
         
         DragDropArea:hover {{
-            border-color: {cls.COLORS['accent']};
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                stop:0 {cls.COLORS['surface_light']}, 
-                stop:1 {cls.COLORS['primary']});
+            border-color: {accent};
+            background: {primary};
         }}
         
         /* Buttons */
         QPushButton {{
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 {cls.COLORS['primary']}, 
-                stop:1 {cls.COLORS['primary_dark']});
-            color: {cls.COLORS['text_primary']};
+            background: {primary};
+            color: {text_primary};
             border: none;
             padding: 12px 24px;
             border-radius: 8px;
@@ -83,79 +174,86 @@ class ThemeManager:
         }}
         
         QPushButton:hover {{
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 {cls.COLORS['primary_light']}, 
-                stop:1 {cls.COLORS['primary']});
+            background: {primary_light};
         }}
         
         QPushButton:pressed {{
-            background: {cls.COLORS['primary_dark']};
+            background: {primary_dark};
         }}
         
         QPushButton:disabled {{
-            background: {cls.COLORS['surface_light']};
-            color: {cls.COLORS['text_muted']};
+            background: {surface_light};
+            color: {text_muted};
         }}
         
         /* Secondary Button */
         QPushButton#secondary {{
-            background: {cls.COLORS['surface']};
-            color: {cls.COLORS['text_secondary']};
-            border: 1px solid {cls.COLORS['border']};
+            background: {surface};
+            color: {text_secondary};
+            border: 1px solid {border};
         }}
         
         QPushButton#secondary:hover {{
-            background: {cls.COLORS['hover']};
-            border-color: {cls.COLORS['accent']};
+            background: {hover};
+            border-color: {accent};
         }}
         
         /* Group Boxes */
         QGroupBox {{
             font-weight: bold;
             font-size: 14px;
-            color: {cls.COLORS['text_primary']};
-            border: 2px solid {cls.COLORS['border']};
+            color: {text_primary};
+            border: 2px solid {border};
             border-radius: 10px;
             margin-top: 10px;
             padding-top: 10px;
-            background: {cls.COLORS['surface']};
+            background: {surface};
         }}
         
         QGroupBox::title {{
             subcontrol-origin: margin;
             left: 10px;
             padding: 0 10px 0 10px;
-            color: {cls.COLORS['accent']};
+            color: {accent};
         }}
         
         /* Labels */
         QLabel {{
-            color: {cls.COLORS['text_primary']};
+            color: {text_primary};
         }}
         
         QLabel#title {{
             font-size: 18px;
             font-weight: bold;
-            color: {cls.COLORS['accent']};
+            color: {accent};
         }}
         
         QLabel#subtitle {{
             font-size: 12px;
-            color: {cls.COLORS['text_secondary']};
+            color: {text_secondary};
+        }}
+        
+        QLabel#fileIcon {{
+            font-size: 48px;
+        }}
+        
+        QLabel#logoFallback {{
+            font-size: 48px;
+            color: {accent};
         }}
         
         /* Combo Boxes */
         QComboBox {{
-            background: {cls.COLORS['surface']};
-            color: {cls.COLORS['text_primary']};
-            border: 2px solid {cls.COLORS['border']};
+            background: {surface};
+            color: {text_primary};
+            border: 2px solid {border};
             border-radius: 6px;
             padding: 8px 12px;
             min-width: 120px;
         }}
         
         QComboBox:hover {{
-            border-color: {cls.COLORS['accent']};
+            border-color: {accent};
         }}
         
         QComboBox::drop-down {{
@@ -167,105 +265,96 @@ class ThemeManager:
             image: none;
             border-left: 5px solid transparent;
             border-right: 5px solid transparent;
-            border-top: 5px solid {cls.COLORS['text_secondary']};
+            border-top: 5px solid {text_secondary};
             margin-right: 5px;
         }}
         
         QComboBox QAbstractItemView {{
-            background: {cls.COLORS['surface']};
-            color: {cls.COLORS['text_primary']};
-            border: 1px solid {cls.COLORS['border']};
-            selection-background-color: {cls.COLORS['primary']};
+            background: {surface};
+            color: {text_primary};
+            border: 1px solid {border};
+            selection-background-color: {primary};
         }}
         
         /* Check Boxes */
         QCheckBox {{
-            color: {cls.COLORS['text_primary']};
+            color: {text_primary};
             font-size: 13px;
         }}
         
         QCheckBox::indicator {{
             width: 18px;
             height: 18px;
-            border: 2px solid {cls.COLORS['border']};
+            border: 2px solid {border};
             border-radius: 4px;
-            background: {cls.COLORS['surface']};
+            background: {surface};
         }}
         
         QCheckBox::indicator:checked {{
-            background: {cls.COLORS['accent']};
-            border-color: {cls.COLORS['accent']};
+            background: {accent};
+            border-color: {accent};
         }}
         
         QCheckBox::indicator:hover {{
-            border-color: {cls.COLORS['accent']};
+            border-color: {accent};
         }}
         
         /* Spin Boxes */
         QSpinBox {{
-            background: {cls.COLORS['surface']};
-            color: {cls.COLORS['text_primary']};
-            border: 2px solid {cls.COLORS['border']};
+            background: {surface};
+            color: {text_primary};
+            border: 2px solid {border};
             border-radius: 6px;
             padding: 8px;
             min-width: 80px;
         }}
         
         QSpinBox:hover {{
-            border-color: {cls.COLORS['accent']};
+            border-color: {accent};
         }}
         
         QSpinBox:focus {{
-            border-color: {cls.COLORS['accent']};
+            border-color: {accent};
         }}
         
         /* Progress Bar */
         QProgressBar {{
-            border: 2px solid {cls.COLORS['border']};
+            border: 2px solid {border};
             border-radius: 8px;
             text-align: center;
-            background: {cls.COLORS['surface']};
-            color: {cls.COLORS['text_primary']};
+            background: {surface};
+            color: {text_primary};
         }}
         
         QProgressBar::chunk {{
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                stop:0 {cls.COLORS['accent']}, 
-                stop:1 {cls.COLORS['accent_light']});
+            background: {accent};
             border-radius: 6px;
         }}
         
         /* Status Bar */
         QStatusBar {{
-            background: {cls.COLORS['surface']};
-            color: {cls.COLORS['text_secondary']};
-            border-top: 1px solid {cls.COLORS['border']};
+            background: {surface};
+            color: {text_secondary};
+            border-top: 1px solid {border};
         }}
         
         /* File Info Widget */
         QWidget#fileInfo {{
-            background: {cls.COLORS['surface']};
-            border: 2px solid {cls.COLORS['border']};
+            background: {surface};
+            border: 2px solid {border};
             border-radius: 10px;
             padding: 15px;
         }}
         
-        /* Dialog Boxes */
-        QDialog {{
-            background-color: {cls.COLORS['surface']};
-            color: {cls.COLORS['text_primary']};
-        }}
-        
+        /* Message Boxes */
         QMessageBox {{
-            background-color: {cls.COLORS['surface']};
-            color: {cls.COLORS['text_primary']};
+            background-color: {surface};
+            color: {text_primary};
         }}
         
         QMessageBox QPushButton {{
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 {cls.COLORS['primary']}, 
-                stop:1 {cls.COLORS['primary_dark']});
-            color: {cls.COLORS['text_primary']};
+            background: {primary};
+            color: {text_primary};
             border: none;
             padding: 8px 16px;
             border-radius: 6px;
@@ -274,118 +363,59 @@ class ThemeManager:
         }}
         
         QMessageBox QPushButton:hover {{
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 {cls.COLORS['primary_light']}, 
-                stop:1 {cls.COLORS['primary']});
-        }}
-        
-        QMessageBox QLabel {{
-            color: {cls.COLORS['text_primary']};
-            background-color: transparent;
-        }}
-        
-        /* File Dialog */
-        QFileDialog {{
-            background-color: {cls.COLORS['surface']};
-            color: {cls.COLORS['text_primary']};
-        }}
-        
-        QFileDialog QWidget {{
-            background-color: {cls.COLORS['surface']};
-            color: {cls.COLORS['text_primary']};
-        }}
-        
-        QFileDialog QListView {{
-            background-color: {cls.COLORS['background']};
-            color: {cls.COLORS['text_primary']};
-            border: 1px solid {cls.COLORS['border']};
-        }}
-        
-        QFileDialog QListView::item {{
-            padding: 5px;
-            border-bottom: 1px solid {cls.COLORS['border']};
-        }}
-        
-        QFileDialog QListView::item:selected {{
-            background-color: {cls.COLORS['primary']};
-        }}
-        
-        QFileDialog QListView::item:hover {{
-            background-color: {cls.COLORS['hover']};
-        }}
-        
-        QFileDialog QLineEdit {{
-            background-color: {cls.COLORS['background']};
-            color: {cls.COLORS['text_primary']};
-            border: 2px solid {cls.COLORS['border']};
-            border-radius: 4px;
-            padding: 5px;
-        }}
-        
-        QFileDialog QLineEdit:focus {{
-            border-color: {cls.COLORS['accent']};
-        }}
-        
-        QFileDialog QComboBox {{
-            background-color: {cls.COLORS['background']};
-            color: {cls.COLORS['text_primary']};
-            border: 2px solid {cls.COLORS['border']};
-            border-radius: 4px;
-            padding: 5px;
-        }}
-        
-        QFileDialog QComboBox:hover {{
-            border-color: {cls.COLORS['accent']};
-        }}
-        
-        QFileDialog QComboBox QAbstractItemView {{
-            background-color: {cls.COLORS['surface']};
-            color: {cls.COLORS['text_primary']};
-            border: 1px solid {cls.COLORS['border']};
-            selection-background-color: {cls.COLORS['primary']};
-        }}
-        
-        QFileDialog QPushButton {{
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 {cls.COLORS['primary']}, 
-                stop:1 {cls.COLORS['primary_dark']});
-            color: {cls.COLORS['text_primary']};
-            border: none;
-            padding: 8px 16px;
-            border-radius: 6px;
-            font-weight: bold;
-            min-width: 80px;
-        }}
-        
-        QFileDialog QPushButton:hover {{
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 {cls.COLORS['primary_light']}, 
-                stop:1 {cls.COLORS['primary']});
-        }}
-        
-        QFileDialog QPushButton:pressed {{
-            background: {cls.COLORS['primary_dark']};
-        }}
-        
-        QFileDialog QPushButton:disabled {{
-            background: {cls.COLORS['surface_light']};
-            color: {cls.COLORS['text_muted']};
+            background: {primary_light};
         }}
         
         /* Tool Tips */
         QToolTip {{
-            background-color: {cls.COLORS['surface']};
-            color: {cls.COLORS['text_primary']};
-            border: 1px solid {cls.COLORS['border']};
+            background-color: {surface};
+            color: {text_primary};
+            border: 1px solid {border};
             border-radius: 4px;
             padding: 5px;
         }}
-        """
+        """).strip()
+    
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def get_stylesheet(cls):
+        """Get the complete application stylesheet (built once; the palette is static)."""
+        return cls._STYLESHEET_TEMPLATE.format_map(cls.COLORS)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def get_palette(cls):
+        """Get the application palette, used by widgets the stylesheet leaves unstyled (e.g. file dialogs)."""
+        palette = QPalette()
+        roles = {
+            QPalette.ColorRole.Window: 'surface',
+            QPalette.ColorRole.WindowText: 'text_primary',
+            QPalette.ColorRole.Base: 'background',
+            QPalette.ColorRole.AlternateBase: 'surface',
+            QPalette.ColorRole.Text: 'text_primary',
+            QPalette.ColorRole.PlaceholderText: 'text_muted',
+            QPalette.ColorRole.Button: 'primary',
+            QPalette.ColorRole.ButtonText: 'text_primary',
+            QPalette.ColorRole.Highlight: 'primary',
+            QPalette.ColorRole.HighlightedText: 'text_primary',
+            QPalette.ColorRole.ToolTipBase: 'surface',
+            QPalette.ColorRole.ToolTipText: 'text_primary',
+        }
+        for role, color_name in roles.items():
+            palette.setColor(role, QColor(cls.COLORS[color_name]))
+        for role in (QPalette.ColorRole.WindowText, QPalette.ColorRole.Text, QPalette.ColorRole.ButtonText):
+            palette.setColor(QPalette.ColorGroup.Disabled, role, QColor(cls.COLORS['text_muted']))
+        return palette
     
     @classmethod
     def apply_theme(cls, app):
-        """Apply the dark theme to the application."""
+        """Apply the dark theme to the application (once; later calls for the same app do nothing)."""
+        # Re-applying would make Qt re-polish every existing widget for an identical theme
+        if cls._themed_app is app:
+            return
+        app.setPalette(cls.get_palette())
         app.setStyleSheet(cls.get_stylesheet())
+        cls._themed_app = app
 
 
 class DragDropArea(QFrame):
@@ -400,9 +430,7 @@ class DragDropArea(QFrame):
         self.setLineWidth(0)  # Remove default border, using CSS instead
         
         # Create layout
-        layout = QVBoxLayout()
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.setSpacing(20)
+        layout = _vbox(spacing=20, alignment=Qt.AlignmentFlag.AlignCenter)
         
         # Add logo
         self.logo_label = QLabel()
@@ -421,7 +449,7 @@ class DragDropArea(QFrame):
         self.subtitle_label.setObjectName("subtitle")
         
         # Add supported formats
-        self.formats_label = QLabel("Supports: Images • Audio • Video")
+        self.formats_label = QLabel("Supports: Images \u2022 Audio \u2022 Video")
         self.formats_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.formats_label.setObjectName("subtitle")
         
@@ -433,46 +461,14 @@ class DragDropArea(QFrame):
     
     def _load_logo(self):
         """Load the application logo."""
-        import sys
-        
-        # Get the correct path for bundled resources
-        if getattr(sys, 'frozen', False):
-            # Running as PyInstaller executable
-            base_path = sys._MEIPASS
+        pixmap = _scaled_logo(80)
+        if pixmap is not None:
+            self.logo_label.setPixmap(pixmap)
         else:
-            # Running as script
-            base_path = os.path.dirname(os.path.abspath(__file__))
-        
-        logo_paths = [
-            os.path.join(base_path, "resources", "logo.png"),
-            os.path.join(base_path, "logo.png"),
-            os.path.join(base_path, "assets", "logo.png"),
-            "resources/logo.png",  # Fallback for development
-            "logo.png",
-            "assets/logo.png"
-        ]
-        
-        logo_loaded = False
-        for path in logo_paths:
-            if os.path.exists(path):
-                try:
-                    pixmap = QPixmap(path)
-                    if not pixmap.isNull():
-                        # Scale logo to fit
-                        scaled_pixmap = pixmap.scaled(80, 80, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                        self.logo_label.setPixmap(scaled_pixmap)
-                        logo_loaded = True
-                        print(f"Logo loaded from: {path}")  # Debug info
-                        break
-                except Exception as e:
-                    print(f"Error loading logo from {path}: {e}")
-                    continue
-        
-        if not logo_loaded:
             # Fallback to text logo
-            self.logo_label.setText("🔄")
-            self.logo_label.setStyleSheet("font-size: 48px; color: #06b6d4;")
-            print("Using fallback text logo")
+            self.logo_label.setText("\U0001f504")  # anticlockwise arrows
+            self.logo_label.setObjectName("logoFallback")
+            logger.debug("Using fallback text logo")
     
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter event."""
@@ -506,14 +502,13 @@ class FileInfoWidget(QWidget):
     
     def setup_ui(self):
         """Setup the UI for file information display."""
-        layout = QVBoxLayout()
-        layout.setSpacing(15)
-        layout.setContentsMargins(20, 20, 20, 20)
+        layout = _vbox(spacing=15, margins=(20, 20, 20, 20))
         
         # File icon and name
         self.file_icon = QLabel()
         self.file_icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.file_icon.setFixedSize(80, 80)
+        self.file_icon.setObjectName("fileIcon")
         
         self.file_name = QLabel()
         self.file_name.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -533,17 +528,7 @@ class FileInfoWidget(QWidget):
         """Update display with file information."""
         if file_info:
             # Set file icon based on type
-            if file_info.file_type == FileType.IMAGE:
-                icon_text = "🖼️"
-            elif file_info.file_type == FileType.AUDIO:
-                icon_text = "🎵"
-            elif file_info.file_type == FileType.VIDEO:
-                icon_text = "🎬"
-            else:
-                icon_text = "📄"
-            
-            self.file_icon.setText(icon_text)
-            self.file_icon.setStyleSheet("font-size: 48px;")
+            self.file_icon.setText(_ICON_FOR_TYPE.get(file_info.file_type, "\U0001f4c4"))  # page facing up
             
             self.file_name.setText(f"{file_info.filename}{file_info.extension}")
             self.file_size.setText(file_info.size_formatted)
@@ -561,11 +546,30 @@ class ConversionOptionsWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_file_type = None
+        
+        # Coalesce bursts of edits (spinbox arrows, typing) into one options_changed
+        self._options_changed_timer = QTimer(self)
+        self._options_changed_timer.setSingleShot(True)
+        self._options_changed_timer.setInterval(OPTIONS_CHANGED_DEBOUNCE_MS)
+        self._options_changed_timer.timeout.connect(self.options_changed)
+        
         self.setup_ui()
     
     def setup_ui(self):
         """Setup the UI for conversion options."""
         self.layout = QVBoxLayout()
+        
+        # One page per file type, built the first time that type is shown and reused after.
+        # A page's signals are connected once, when it is built, after its defaults are set
+        # (so building never emits); switching pages never reconnects anything.
+        self.stack = QStackedWidget()
+        self._page_builders = {
+            FileType.IMAGE: self._setup_image_options,
+            FileType.AUDIO: self._setup_audio_options,
+            FileType.VIDEO: self._setup_video_options,
+        }
+        self._pages = {}
+        self.layout.addWidget(self.stack)
         self.setLayout(self.layout)
         
         # Initially hidden
@@ -575,21 +579,24 @@ class ConversionOptionsWidget(QWidget):
         """Update options based on file type."""
         self.current_file_type = file_type
         
-        # Clear existing widgets
-        for i in reversed(range(self.layout.count())):
-            self.layout.itemAt(i).widget().setParent(None)
-        
-        if file_type == FileType.IMAGE:
-            self._setup_image_options()
-        elif file_type == FileType.AUDIO:
-            self._setup_audio_options()
-        elif file_type == FileType.VIDEO:
-            self._setup_video_options()
-        else:
-            self.setVisible(False)
-            return
-        
+        page = self._pages.get(file_type)
+        if page is None:
+            build_page = self._page_builders.get(file_type)
+            if build_page is None:
+                self.setVisible(False)
+                return
+            page = self._pages[file_type] = build_page()
+        
+        # Size the stack to the current page only, not the tallest one
+        for other in self._pages.values():
+            policy = QSizePolicy.Policy.Preferred if other is page else QSizePolicy.Policy.Ignored
+            other.setSizePolicy(policy, policy)
+        self.stack.setCurrentWidget(page)
         self.setVisible(True)
+        
+        # Pages keep their values between files, so hand them to the new file's options now
+        self._options_changed_timer.stop()
+        self.options_changed.emit()
     
     def _setup_image_options(self):
         """Setup image conversion options."""
@@ -600,7 +607,7 @@ class ConversionOptionsWidget(QWidget):
         format_layout = QHBoxLayout()
         format_layout.addWidget(QLabel("Output Format:"))
         self.format_combo = QComboBox()
-        self.format_combo.addItems(["PNG", "JPG"])
+        self.format_combo.addItems(["PNG", "JPG", "WEBP"])
         self.format_combo.currentTextChanged.connect(self._on_options_changed)
         format_layout.addWidget(self.format_combo)
         format_layout.addStretch()
@@ -649,7 +656,8 @@ class ConversionOptionsWidget(QWidget):
         layout.addLayout(size_limit_layout)
         
         group.setLayout(layout)
-        self.layout.addWidget(group)
+        self.stack.addWidget(group)
+        return group
     
     def _setup_audio_options(self):
         """Setup audio conversion options."""
@@ -659,16 +667,18 @@ class ConversionOptionsWidget(QWidget):
         # Quality selection
         quality_layout = QHBoxLayout()
         quality_layout.addWidget(QLabel("Audio Quality:"))
-        self.quality_combo = QComboBox()
-        self.quality_combo.addItems([
-            "128 kbps (Standard)",
-            "192 kbps (Good)",
-            "256 kbps (High Quality)",
-            "320 kbps (Lossless Quality)"
-        ])
-        self.quality_combo.setCurrentIndex(1)  # Default to "Good"
-        self.quality_combo.currentTextChanged.connect(self._on_options_changed)
-        quality_layout.addWidget(self.quality_combo)
+        self.audio_quality_combo = QComboBox()
+        # Each item carries its quality code, so reading it back needs no text parsing
+        for label, quality in (
+            ("128 kbps (Standard)", "128"),
+            ("192 kbps (Good)", "192"),
+            ("256 kbps (High Quality)", "256"),
+            ("320 kbps (Lossless Quality)", "320")
+        ):
+            self.audio_quality_combo.addItem(label, quality)
+        self.audio_quality_combo.setCurrentIndex(1)  # Default to "Good"
+        self.audio_quality_combo.currentTextChanged.connect(self._on_options_changed)
+        quality_layout.addWidget(self.audio_quality_combo)
         quality_layout.addStretch()
         layout.addLayout(quality_layout)
         
@@ -678,7 +688,8 @@ class ConversionOptionsWidget(QWidget):
         layout.addWidget(info_label)
         
         group.setLayout(layout)
-        self.layout.addWidget(group)
+        self.stack.addWidget(group)
+        return group
     
     def _setup_video_options(self):
         """Setup video conversion options."""
@@ -688,16 +699,17 @@ class ConversionOptionsWidget(QWidget):
         # Quality selection
         quality_layout = QHBoxLayout()
         quality_layout.addWidget(QLabel("Video Quality:"))
-        self.quality_combo = QComboBox()
-        self.quality_combo.addItems([
-            "480p (Standard Definition)",
-            "720p (HD)",
-            "1080p (Full HD)",
-            "Original (Keep source quality)"
-        ])
-        self.quality_combo.setCurrentIndex(3)  # Default to "Original"
-        self.quality_combo.currentTextChanged.connect(self._on_options_changed)
-        quality_layout.addWidget(self.quality_combo)
+        self.video_quality_combo = QComboBox()
+        for label, quality in (
+            ("480p (Standard Definition)", "480p"),
+            ("720p (HD)", "720p"),
+            ("1080p (Full HD)", "1080p"),
+            ("Original (Keep source quality)", "original")
+        ):
+            self.video_quality_combo.addItem(label, quality)
+        self.video_quality_combo.setCurrentIndex(3)  # Default to "Original"
+        self.video_quality_combo.currentTextChanged.connect(self._on_options_changed)
+        quality_layout.addWidget(self.video_quality_combo)
         quality_layout.addStretch()
         layout.addLayout(quality_layout)
         
@@ -714,7 +726,8 @@ class ConversionOptionsWidget(QWidget):
         layout.addWidget(info_label)
         
         group.setLayout(layout)
-        self.layout.addWidget(group)
+        self.stack.addWidget(group)
+        return group
     
     def _on_resize_toggled(self, checked):
         """Handle resize checkbox toggle."""
@@ -728,8 +741,14 @@ class ConversionOptionsWidget(QWidget):
         self._on_options_changed()
     
     def _on_options_changed(self):
-        """Emit options changed signal."""
-        self.options_changed.emit()
+        """Emit options changed signal once edits settle."""
+        self._options_changed_timer.start()
+    
+    def flush_options_changed(self):
+        """Emit a pending options changed signal now instead of waiting for the timer."""
+        if self._options_changed_timer.isActive():
+            self._options_changed_timer.stop()
+            self.options_changed.emit()
     
     def get_image_options(self):
         """Get current image options."""
@@ -757,35 +776,14 @@ class ConversionOptionsWidget(QWidget):
         if self.current_file_type != FileType.AUDIO:
             return None
         
-        quality_text = self.quality_combo.currentText()
-        if "128" in quality_text:
-            quality = "128"
-        elif "192" in quality_text:
-            quality = "192"
-        elif "256" in quality_text:
-            quality = "256"
-        elif "320" in quality_text:
-            quality = "320"
-        else:
-            quality = "192"
-        
-        return {'quality': quality}
+        return {'quality': self.audio_quality_combo.currentData()}
     
     def get_video_options(self):
         """Get current video options."""
         if self.current_file_type != FileType.VIDEO:
             return None
         
-        quality_text = self.quality_combo.currentText()
-        if "480p" in quality_text:
-            quality = "480p"
-        elif "720p" in quality_text:
-            quality = "720p"
-        elif "1080p" in quality_text:
-            quality = "1080p"
-        else:
-            quality = "original"
-        
+        quality = self.video_quality_combo.currentData()
         fast_mode = self.fast_mode_checkbox.isChecked()
         
         return {'quality': quality, 'fast_mode': fast_mode}
@@ -797,7 +795,17 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.viewmodel = MainViewModel()
+        # Result message boxes, created on first use per icon and reused after
+        self._msg_boxes = {}
+        # (conversion options object, options dict) last pushed to the viewmodel
+        self._applied_options = None
         self.setup_ui()
+        # File type -> (read options from the widget, push them to the viewmodel)
+        self._options_handlers = {
+            FileType.IMAGE: (self.conversion_options_widget.get_image_options, self._apply_image_options),
+            FileType.AUDIO: (self.conversion_options_widget.get_audio_options, self._apply_audio_options),
+            FileType.VIDEO: (self.conversion_options_widget.get_video_options, self._apply_video_options),
+        }
         self.connect_signals()
         self.setWindowTitle("FormatFusion - File Converter")
         self.setMinimumSize(600, 500)
@@ -811,83 +819,23 @@ class MainWindow(QMainWindow):
     
     def _set_app_icon(self):
         """Set the application icon from logo file."""
-        import sys
-        
-        # Get the correct path for bundled resources
-        if getattr(sys, 'frozen', False):
-            # Running as PyInstaller executable
-            base_path = sys._MEIPASS
-        else:
-            # Running as script
-            base_path = os.path.dirname(os.path.abspath(__file__))
-        
-        logo_paths = [
-            os.path.join(base_path, "resources", "logo.png"),
-            os.path.join(base_path, "logo.png"),
-            os.path.join(base_path, "assets", "logo.png"),
-            "resources/logo.png",  # Fallback for development
-            "logo.png",
-            "assets/logo.png"
-        ]
-        
-        icon_loaded = False
-        for path in logo_paths:
-            if os.path.exists(path):
-                try:
-                    icon = QIcon(path)
-                    if not icon.isNull():
-                        self.setWindowIcon(icon)
-                        # Also set the app icon globally
-                        QApplication.instance().setWindowIcon(icon)
-                        icon_loaded = True
-                        print(f"App icon loaded from: {path}")  # Debug info
-                        break
-                except Exception as e:
-                    print(f"Error loading app icon from {path}: {e}")
-                    continue
-        
-        # If no logo found, create a simple icon
-        if not icon_loaded:
-            self._create_fallback_icon()
-            print("Using fallback app icon")
+        self._apply_icon(app_icon())
     
-    def _create_fallback_icon(self):
-        """Create a fallback icon if no logo is found."""
-        from PyQt6.QtGui import QPainter, QBrush, QPen
-        from PyQt6.QtCore import QRect
-        
-        # Create a 32x32 pixmap for the icon
-        pixmap = QPixmap(32, 32)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw a simple gear/convert icon
-        painter.setBrush(QBrush(Qt.GlobalColor.cyan))
-        painter.setPen(QPen(Qt.GlobalColor.white, 2))
-        painter.drawEllipse(4, 4, 24, 24)
-        
-        # Draw arrow
-        painter.setPen(QPen(Qt.GlobalColor.white, 3))
-        painter.drawLine(10, 16, 22, 16)
-        painter.drawLine(18, 12, 22, 16)
-        painter.drawLine(18, 20, 22, 16)
-        
-        painter.end()
-        
-        icon = QIcon(pixmap)
+    def _apply_icon(self, icon: QIcon):
+        """Set this window's icon, and the app icon if none is set yet."""
         self.setWindowIcon(icon)
-        QApplication.instance().setWindowIcon(icon)
+        # Setting the app icon notifies every top-level window, so only do it once
+        app = QApplication.instance()
+        if app.windowIcon().isNull():
+            app.setWindowIcon(icon)
     
     def setup_ui(self):
         """Setup the main UI."""
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         
-        # Main layout
+        # Main layout (attached once it is filled, so the widget lays out once)
         main_layout = QVBoxLayout()
-        central_widget.setLayout(main_layout)
         
         # Drag and drop area
         self.drag_drop_area = DragDropArea()
@@ -920,6 +868,7 @@ class MainWindow(QMainWindow):
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
         main_layout.addWidget(self.progress_bar)
+        central_widget.setLayout(main_layout)
         
         # Status bar
         self.status_bar = self.statusBar()
@@ -943,7 +892,8 @@ class MainWindow(QMainWindow):
         self.viewmodel.conversion_options_changed.connect(self._on_conversion_options_changed)
         self.viewmodel.conversion_started.connect(self._on_conversion_started)
         self.viewmodel.conversion_progress.connect(self._on_conversion_progress)
-        self.viewmodel.conversion_finished.connect(self._on_conversion_finished)
+        self.viewmodel.conversion_succeeded.connect(self._on_conversion_succeeded)
+        self.viewmodel.conversion_failed.connect(self._on_conversion_failed)
         self.viewmodel.status_message.connect(self._on_status_message)
     
     @pyqtSlot(str)
@@ -959,6 +909,9 @@ class MainWindow(QMainWindow):
     @pyqtSlot()
     def _on_convert_clicked(self):
         """Handle convert button click."""
+        # Apply any option edits still waiting out the debounce
+        self.conversion_options_widget.flush_options_changed()
+        
         if not self.viewmodel.can_convert():
             return
         
@@ -973,34 +926,6 @@ class MainWindow(QMainWindow):
         msg_box.setDefaultButton(QMessageBox.StandardButton.No)
         msg_box.setIcon(QMessageBox.Icon.Question)
         
-        # Apply custom styling
-        msg_box.setStyleSheet("""
-            QMessageBox {
-                background-color: #1e293b;
-                color: #f8fafc;
-            }
-            QMessageBox QLabel {
-                color: #f8fafc;
-                background-color: transparent;
-            }
-            QMessageBox QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1e3a8a, 
-                    stop:1 #1e40af);
-                color: #f8fafc;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: bold;
-                min-width: 80px;
-            }
-            QMessageBox QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #3b82f6, 
-                    stop:1 #1e3a8a);
-            }
-        """)
-        
         reply = msg_box.exec()
         
         if reply == QMessageBox.StandardButton.Yes:
@@ -1009,7 +934,7 @@ class MainWindow(QMainWindow):
                 self,
                 "Save Converted File",
                 default_output_path,
-                f"Converted Files (*{Path(default_output_path).suffix})"
+                f"Converted Files (*{self.viewmodel.get_output_suffix()})"
             )
             if not file_path:
                 return  # User cancelled
@@ -1030,29 +955,42 @@ class MainWindow(QMainWindow):
         if not self.viewmodel.current_file:
             return
         
-        # Update viewmodel with current options
-        if self.viewmodel.current_file.file_type == FileType.IMAGE:
-            options = self.conversion_options_widget.get_image_options()
-            if options:
-                self.viewmodel.update_image_format(options['format'])
-                self.viewmodel.update_image_resize(
-                    options['resize_enabled'],
-                    options['max_width'],
-                    options['max_height']
-                )
-                self.viewmodel.update_image_size_limit(
-                    options['size_limit_enabled'],
-                    options['max_size_kb']
-                )
-        elif self.viewmodel.current_file.file_type == FileType.AUDIO:
-            options = self.conversion_options_widget.get_audio_options()
-            if options:
-                self.viewmodel.update_audio_quality(options['quality'])
-        elif self.viewmodel.current_file.file_type == FileType.VIDEO:
-            options = self.conversion_options_widget.get_video_options()
-            if options:
-                self.viewmodel.update_video_quality(options['quality'])
-                self.viewmodel.update_video_fast_mode(options['fast_mode'])
+        handlers = self._options_handlers.get(self.viewmodel.current_file.file_type)
+        if handlers is None:
+            return
+        get_options, apply_options = handlers
+        options = get_options()
+        if not options:
+            return
+        
+        # Skip values already pushed to this file's options (a new file gets a new options object)
+        conversion_options = self.viewmodel.conversion_options
+        if (self._applied_options is not None
+                and self._applied_options[0] is conversion_options
+                and self._applied_options[1] == options):
+            return
+        self._applied_options = (conversion_options, options)
+        
+        apply_options(options)
+    
+    def _apply_image_options(self, options):
+        """Push image options to the viewmodel (one options-changed signal for all fields)."""
+        self.viewmodel.update_image_options(
+            options['format'],
+            options['resize_enabled'],
+            options['max_width'],
+            options['max_height'],
+            options['size_limit_enabled'],
+            options['max_size_kb']
+        )
+    
+    def _apply_audio_options(self, options):
+        """Push audio options to the viewmodel."""
+        self.viewmodel.update_audio_quality(options['quality'])
+    
+    def _apply_video_options(self, options):
+        """Push video options to the viewmodel (one options-changed signal for all fields)."""
+        self.viewmodel.update_video_options(options['quality'], options['fast_mode'])
     
     @pyqtSlot(object)
     def _on_file_loaded(self, file_info):
@@ -1088,16 +1026,19 @@ class MainWindow(QMainWindow):
         """Handle conversion progress signal."""
         self.progress_bar.setValue(progress)
     
-    @pyqtSlot(bool, str)
-    def _on_conversion_finished(self, success: bool, message: str):
-        """Handle conversion finished signal."""
+    @pyqtSlot(str)
+    def _on_conversion_succeeded(self, output_path: str):
+        """Handle conversion succeeded signal."""
         self.convert_button.setEnabled(True)
         self.progress_bar.setVisible(False)
-        
-        if success:
-            self._show_message_box("Conversion Complete", f"File converted successfully!\nSaved to: {message}", QMessageBox.Icon.Information)
-        else:
-            self._show_message_box("Conversion Failed", f"Conversion failed: {message}", QMessageBox.Icon.Critical)
+        self._show_message_box("Conversion Complete", f"File converted successfully!\nSaved to: {output_path}", QMessageBox.Icon.Information)
+    
+    @pyqtSlot(str)
+    def _on_conversion_failed(self, message: str):
+        """Handle conversion failed signal."""
+        self.convert_button.setEnabled(True)
+        self.progress_bar.setVisible(False)
+        self._show_message_box("Conversion Failed", f"Conversion failed: {message}", QMessageBox.Icon.Critical)
     
     @pyqtSlot(str)
     def _on_status_message(self, message: str):
@@ -1106,38 +1047,13 @@ class MainWindow(QMainWindow):
     
     def _show_message_box(self, title: str, message: str, icon: QMessageBox.Icon):
         """Show a styled message box."""
-        msg_box = QMessageBox(self)
+        msg_box = self._msg_boxes.get(icon)
+        if msg_box is None:
+            msg_box = QMessageBox(self)
+            msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+            msg_box.setIcon(icon)
+            self._msg_boxes[icon] = msg_box
+        
         msg_box.setWindowTitle(title)
         msg_box.setText(message)
-        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-        msg_box.setIcon(icon)
-        
-        # Apply custom styling
-        msg_box.setStyleSheet("""
-            QMessageBox {
-                background-color: #1e293b;
-                color: #f8fafc;
-            }
-            QMessageBox QLabel {
-                color: #f8fafc;
-                background-color: transparent;
-            }
-            QMessageBox QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1e3a8a, 
-                    stop:1 #1e40af);
-                color: #f8fafc;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: bold;
-                min-width: 80px;
-            }
-            QMessageBox QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #3b82f6, 
-                    stop:1 #1e3a8a);
-            }
-        """)
-        
         msg_box.exec()